@@ -1,6 +1,8 @@
 """Run all tests for the DunGen project."""
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 # Add project root to path
@@ -23,27 +25,30 @@ def run_all_tests():
     
     start_time = time.time()
     
+    # partial() instead of lambdas so the suites can be pickled into workers
     test_suites = [
         ("PCG Algorithms", test_pcg),
         ("LLM Targeted Prompts", test_llm_prompts),
-        ("LLM Bias", lambda: test_llm_bias(num_tests=10)),
-        ("Config Validation", lambda: test_parameter_ranges(num_tests=5)),
+        ("LLM Bias", partial(test_llm_bias, num_tests=10)),
+        ("Config Validation", partial(test_parameter_ranges, num_tests=5)),
         ("Mission System", test_mission_system),
     ]
-    
+
     results = {}
-    
-    for name, test_func in test_suites:
-        print(f"\n{'='*70}")
-        print(f"Running: {name}")
-        print(f"{'='*70}")
-        
-        try:
-            success = test_func()
-            results[name] = "PASS" if success else "FAIL"
-        except Exception as e:
-            print(f"\n[ERROR] Test suite crashed: {e}")
-            results[name] = "ERROR"
+
+    # Run the suites in parallel worker processes; the slow suites are the
+    # LLM-bound ones, so wall time drops to roughly the slowest suite. Suite
+    # output may interleave, but each suite's result is collected separately.
+    with ProcessPoolExecutor(max_workers=len(test_suites)) as pool:
+        futures = [(name, pool.submit(test_func)) for name, test_func in test_suites]
+
+        for name, future in futures:
+            try:
+                success = future.result()
+                results[name] = "PASS" if success else "FAIL"
+            except Exception as e:
+                print(f"\n[ERROR] Test suite crashed: {e}")
+                results[name] = "ERROR"
     
     # Summary
     elapsed = time.time() - start_time
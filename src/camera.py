@@ -6,6 +6,8 @@ methods to calculate which tiles are visible and how to convert world coordinate
 to screen coordinates.
 """
 
+import numpy as np
+
 
 class Camera:
     """Handles camera position, viewport calculations, and coordinate conversions."""
@@ -34,6 +36,12 @@ class Camera:
         self.viewport_width_tiles = window_width // tile_size
         self.viewport_height_tiles = window_height // tile_size
 
+        # Precompute half-viewport extents (and inverse tile size) once so the
+        # per-call/per-tile methods don't redo the division every invocation.
+        self._half_viewport_width = self.viewport_width_tiles / 2
+        self._half_viewport_height = self.viewport_height_tiles / 2
+        self._inv_tile_size = 1.0 / tile_size
+
     def set_map_dimensions(self, map_width: int, map_height: int) -> None:
         """Set the dimensions of the current map for bounds checking.
 
@@ -60,27 +68,27 @@ class Camera:
 
     def _clamp_to_bounds(self) -> None:
         """Clamp camera position to ensure we don't show area outside the map."""
-        # Calculate half viewport size
-        half_viewport_width = self.viewport_width_tiles / 2
-        half_viewport_height = self.viewport_height_tiles / 2
+        # Use the half viewport size precomputed in __init__
+        half_viewport_width = self._half_viewport_width
+        half_viewport_height = self._half_viewport_height
 
         # Clamp X coordinate
         if self.map_width <= self.viewport_width_tiles:
             # Center the map
             self.x = self.map_width / 2
         else:
-            # Normal clamping
-            self.x = max(half_viewport_width, self.x)
-            self.x = min(self.map_width - half_viewport_width, self.x)
+            # Fused clamp: single expression, no attribute re-reads between ops
+            self.x = min(max(self.x, half_viewport_width),
+                         self.map_width - half_viewport_width)
 
         # Clamp Y coordinate
         if self.map_height <= self.viewport_height_tiles:
             # Center the map
             self.y = self.map_height / 2
         else:
-            # Normal clamping
-            self.y = max(half_viewport_height, self.y)
-            self.y = min(self.map_height - half_viewport_height, self.y)
+            # Fused clamp: single expression, no attribute re-reads between ops
+            self.y = min(max(self.y, half_viewport_height),
+                         self.map_height - half_viewport_height)
 
     def get_visible_tile_range(self) -> tuple[int, int, int, int]:
         """Calculate which tiles are currently visible in the viewport.
@@ -89,8 +97,8 @@ class Camera:
             Tuple of (min_x, max_x, min_y, max_y) in tile coordinates
         """
         # Calculate the top-left corner of the viewport
-        half_viewport_width = self.viewport_width_tiles / 2
-        half_viewport_height = self.viewport_height_tiles / 2
+        half_viewport_width = self._half_viewport_width
+        half_viewport_height = self._half_viewport_height
 
         min_x = int(self.x - half_viewport_width)
         max_x = int(self.x + half_viewport_width) + 1
@@ -116,8 +124,8 @@ class Camera:
             Tuple of (screen_x, screen_y) in pixel coordinates
         """
         # Calculate the top-left corner of the viewport in world space
-        half_viewport_width = self.viewport_width_tiles / 2
-        half_viewport_height = self.viewport_height_tiles / 2
+        half_viewport_width = self._half_viewport_width
+        half_viewport_height = self._half_viewport_height
 
         viewport_left = self.x - half_viewport_width
         viewport_top = self.y - half_viewport_height
@@ -128,14 +136,40 @@ class Camera:
 
         return (screen_x, screen_y)
 
+    def world_to_screen_batch(
+        self, world_xs: np.ndarray, world_ys: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Convert arrays of world/tile coordinates to screen pixel coordinates.
+
+        Vectorized equivalent of world_to_screen for converting all visible
+        tiles in one shot instead of one Python call per tile.
+
+        Args:
+            world_xs: Array of x coordinates in tile space
+            world_ys: Array of y coordinates in tile space
+
+        Returns:
+            Tuple of (screen_xs, screen_ys) int32 arrays in pixel coordinates
+        """
+        half_viewport_width = self._half_viewport_width
+        half_viewport_height = self._half_viewport_height
+
+        viewport_left = self.x - half_viewport_width
+        viewport_top = self.y - half_viewport_height
+
+        screen_xs = ((world_xs - viewport_left) * self.tile_size).astype(np.int32)
+        screen_ys = ((world_ys - viewport_top) * self.tile_size).astype(np.int32)
+
+        return (screen_xs, screen_ys)
+
     def get_offset(self) -> tuple[int, int]:
         """Get the pixel offset for rendering.
 
         Returns:
             Tuple of (offset_x, offset_y) in pixels
         """
-        half_viewport_width = self.viewport_width_tiles / 2
-        half_viewport_height = self.viewport_height_tiles / 2
+        half_viewport_width = self._half_viewport_width
+        half_viewport_height = self._half_viewport_height
 
         offset_x = int((self.x - half_viewport_width) * self.tile_size)
         offset_y = int((self.y - half_viewport_height) * self.tile_size)
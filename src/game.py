@@ -5,22 +5,76 @@ and cleanup for pygame dep.
 """
 
 # System Package Deps
+import hashlib
+import json
+import time
+from collections import OrderedDict
 from typing import Any
 from collections.abc import Callable
 
 # External Package Deps
+import numpy as np
 import pygame
 
 # Repo Module Reps
-from src.user_input import (
-    verify_config_mission,
-    get_user_input,
-    place_mission_objectives,
-)
+# src.user_input is imported lazily in selection_menu(); it pulls in the LLM
+# stack (ollama, pydantic) which would otherwise dominate cold-start time.
 from src.pcg_generator import generate_level
 from src.renderer import Renderer, TILE_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT
 from src.player import Player
 
+# Event/key constants hoisted to module level so the hot event loop resolves
+# them with a fast global load instead of an attribute lookup per event.
+_QUIT = pygame.QUIT
+_KEYDOWN = pygame.KEYDOWN
+_NOEVENT = pygame.NOEVENT
+_K_ESCAPE = pygame.K_ESCAPE
+_K_SPACE = pygame.K_SPACE
+_K_R = pygame.K_r
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+
+# Generated levels keyed by config digest; FIFO-bounded so toggling between
+# recently seen configs replays instantly instead of regenerating.
+_LEVEL_CACHE_MAX = 16
+_level_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+
+
+def _get_level(config: dict[str, Any], refresh: bool = False) -> np.ndarray:
+    """Generate (or replay) the level grid for a config.
+
+    Results are memoized on a stable hash of the config so revisiting a
+    previously seen config skips the whole PCG pass. Pass refresh=True to
+    force a fresh roll (the R-key regenerate path), which also updates the
+    cached entry. A copy is always returned so callers can't mutate the
+    cached grid.
+
+    Args:
+        config: Level generation parameters (as passed to generate_level)
+        refresh: Regenerate even on a cache hit
+
+    Returns:
+        np.ndarray: int8 level grid
+    """
+    key = hashlib.blake2b(
+        json.dumps(config, sort_keys=True, default=str).encode()
+    ).digest()
+
+    if not refresh:
+        cached = _level_cache.get(key)
+        if cached is not None:
+            return cached.copy()
+
+    grid = np.asarray(generate_level(config), dtype=np.int8)
+    _level_cache.pop(key, None)
+    if len(_level_cache) >= _LEVEL_CACHE_MAX:
+        _level_cache.popitem(last=False)
+    _level_cache[key] = grid
+    return grid.copy()
+
+
 def singleton(cls, *args: tuple[Any], **kw: dict[str,Any]) -> Callable[..., Any]: # type: ignore
     instances: dict[Any, Any] = {}
     def _singleton(*args: tuple[Any], **kw: dict[str,Any]) -> Any:
@@ -45,6 +99,26 @@ class Game:
         _instance: Class attribute to hold the single instance of the class.
     """
 
+    # Fixed-offset attribute storage: faster lookups in the per-frame
+    # event/render path and no per-instance __dict__.
+    __slots__ = (
+        "running",
+        "game_state",
+        "config",
+        "level_grid",
+        "player",
+        "_dirty",
+        "_dt_ns",
+        "_moved_from",
+        "_full_redraw",
+        "_player_pos",
+        "_next_move_ns",
+        "_clock",
+        "_game_renderer",
+        "_key_handlers",
+        "_menu_handlers",
+    )
+
     def __init__(self) -> None:
         """
         Create singleton instance of the game object. This object handles the
@@ -54,29 +128,92 @@ class Game:
         self.running = True
         self.game_state = "start_menu"
         self.config: dict[str, Any] = {}
-        self.level_grid: list[list[int]] = [[]]
+        # One byte per tile in a single contiguous block, instead of a list of
+        # per-row list objects; also allows slicing out the visible window.
+        self.level_grid: np.ndarray = np.zeros((0, 0), dtype=np.int8)
         self.player: Player | None = None
         # self._game_renderer: Renderer
 
-        # Initialize Pygame
-        pygame.init()
+        # Redraw only when something changed; steady-state frames skip the
+        # full grid traversal and buffer flip entirely.
+        self._dirty = True
 
-        # Initialize Pygame Variables for Class Instance
-        self._clock = pygame.time.Clock()
+        # Last frame duration (monotonic ns) for time-dependent update logic
+        self._dt_ns = 0
+
+        # Incremental-redraw bookkeeping: the tile the player vacated since
+        # the last frame, and whether the whole scene must be repainted.
+        self._moved_from: tuple[int, int] | None = None
+        self._full_redraw = True
+
+        # Player grid position, cached as a tuple and refreshed only on a
+        # successful move so render skips the per-frame accessor call
+        self._player_pos: tuple[int, int] | None = None
+
+        # Earliest monotonic time the next held-key step may fire
+        self._next_move_ns = 0
+
+        # Pygame init (and the clock) happen in setup(), off the construction
+        # path, so creating the Game object stays cheap.
+
+        # Keydown dispatch tables: O(1) dict lookup instead of an if/elif
+        # ladder per event.
+        self._key_handlers: dict[int, Callable[[], None]] = {
+            _K_ESCAPE: self._on_escape,
+            _K_R: self._on_regen,
+        }
+        self._menu_handlers: dict[int, Callable[[], None]] = {
+            _K_SPACE: self._on_start,
+        }
+
+    # Minimum interval between SDL event pumps; polling faster than the frame
+    # rate just burns CPU in SDL_PumpEvents.
+    _EVENT_POLL_PERIOD = 1 / 60
+
+    # How long the start menu sleeps waiting for an event before re-rendering
+    _MENU_WAIT_MS = 16
+
+    # Minimum delay between held-key movement steps (one tile per step)
+    _MOVE_COOLDOWN_NS = 150_000_000
 
     def run(self) -> None:
         """Game flow loop. Main high-level logic for game."""
         self.setup()
+        last_pump = time.perf_counter()
+        prev_frame_ns = time.monotonic_ns()
         while self.running:
-            self.on_event()
             if self.game_state == "start_menu":
-                pass
-            elif self.game_state == "selection_menu":
+                # The menu is idle: block in the OS until an event arrives
+                # (or the frame period passes) instead of spinning at 60 Hz.
+                # wait() removes the event, so hand it back to the queue for
+                # the normal batched drain in on_event.
+                event = pygame.event.wait(self._MENU_WAIT_MS)
+                if event.type != _NOEVENT:
+                    pygame.event.post(event)
+                    self.on_event()
+                    last_pump = time.perf_counter()
+                self.render()
+                continue
+
+            now = time.perf_counter()
+            if now - last_pump >= self._EVENT_POLL_PERIOD:
+                # One pump per frame is plenty: even an 8 kHz mouse queues
+                # ~134 events/frame, far below SDL's 65535-event capacity.
+                pygame.event.pump()
+                self.on_event()
+                last_pump = now
+            if self.game_state == "selection_menu":
                 self.selection_menu()
             else:
                 self.update()
 
             self.render()
+            # Frame delta from the monotonic clock for time-dependent logic;
+            # vsync paces frames that flip, the tick only throttles idle
+            # frames whose flip was skipped by the dirty flag.
+            now_frame_ns = time.monotonic_ns()
+            self._dt_ns = now_frame_ns - prev_frame_ns
+            prev_frame_ns = now_frame_ns
             self._clock.tick(60)
         self.on_cleanup()
 
@@ -87,9 +224,23 @@ class Game:
         # init pygame if not already
         if pygame.get_init() is False:
             pygame.init()
+
+        # Initialize Pygame Variables for Class Instance
+        self._clock = pygame.time.Clock()
+
+        # Only QUIT and KEYDOWN are ever handled; whitelist them so mouse
+        # motion and other spammy event types are dropped at the SDL filter
+        # layer and never enter the Python queue.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([_QUIT, _KEYDOWN])
+        # Movement polls the key bitmap in update(); OS autorepeat is unused
+        pygame.key.set_repeat(0)
+
         # Set caption to the game window
         pygame.display.set_caption("DunGen: A User Driven PCG Game")
         self._game_renderer = Renderer(600, 400)
+        # Convert cached surfaces to the display format once, up front
+        self._game_renderer.preload_tiles()
 
         return
 
@@ -97,62 +248,100 @@ class Game:
         """
         Function to handle user inputs for every game update loop.
         """
+        # The queue is pumped once per frame by run(); every access here uses
+        # pump=False so SDL is never re-polled mid-drain.
+        # A pending QUIT makes the rest of the batch stale: shut down at once
+        # instead of processing potentially hundreds of queued events first.
+        if pygame.event.peek(_QUIT, pump=False):
+            self.running = False
+            pygame.event.clear(pump=False)
+            return
+        # Empty queue is the common case; skip allocating an event list for it
+        if not pygame.event.peek(pump=False):
+            return
         # For every event that occured in the current game update
-        for event in pygame.event.get():
+        for event in pygame.event.get(pump=False):
             # -------------------------------- Close Game -------------------------------- #
             # if window close button clicked then stop running Game.
-            if event.type == pygame.QUIT:
+            if event.type == _QUIT:
                 self.running = False
                 break
 
             # -------------------------------- Start Menu -------------------------------- #
             elif self.game_state == "start_menu":
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    self.game_state = "selection_menu"
-                    break
+                if event.type == _KEYDOWN:
+                    handler = self._menu_handlers.get(event.key)
+                    if handler is not None:
+                        handler()
 
             # ------------------------------- Game Started ------------------------------- #
-            # elif user presses a key then handle accordingly.
-            elif event.type == pygame.KEYDOWN:
-                # if the user presses left escape then stop the running Game and exit.
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                    break
-                # if user presses space then regenerate level
-                elif event.key == pygame.K_r:
-                    print("Regenerating level...")
-                    try:
-                        self.level_grid = generate_level(self.config)
-                    except Exception as e:  # pylint: disable=broad-except
-                        # Keep the old grid if regeneration fails
-                        print(f"Error during level regeneration: {e}")
-                # Handle player movement with arrow keys (one move per key press)
-                elif self.player is not None and self.game_state == "game":
-                    if event.key == pygame.K_UP:
-                        self.player.move(0, -1, self.level_grid)
-                    elif event.key == pygame.K_DOWN:
-                        self.player.move(0, 1, self.level_grid)
-                    elif event.key == pygame.K_LEFT:
-                        self.player.move(-1, 0, self.level_grid)
-                    elif event.key == pygame.K_RIGHT:
-                        self.player.move(1, 0, self.level_grid)
+            # elif user presses a key then dispatch to the bound handler.
+            elif event.type == _KEYDOWN:
+                handler = self._key_handlers.get(event.key)
+                if handler is not None:
+                    handler()
+                    if not self.running:
+                        break
+
+    def _on_start(self) -> None:
+        """Leave the start menu for the selection menu (SPACE)."""
+        self.game_state = "selection_menu"
+        self._dirty = True
+        self._full_redraw = True
+
+    def _on_escape(self) -> None:
+        """Stop the running Game and exit (ESC)."""
+        self.running = False
+
+    def _on_regen(self) -> None:
+        """Regenerate the current level from the stored config (R)."""
+        print("Regenerating level...")
+        try:
+            # refresh=True: an explicit regenerate should roll a new layout
+            self.level_grid = _get_level(self.config, refresh=True)
+            self._game_renderer.bake_level_surface(self.level_grid)
+            self._dirty = True
+            self._full_redraw = True
+        except Exception as e:  # pylint: disable=broad-except
+            # Keep the old grid if regeneration fails
+            print(f"Error during level regeneration: {e}")
+
+    def _on_move(self, dx: int, dy: int) -> None:
+        """Move the player one tile in the given direction."""
+        if self.player is not None and self.game_state == "game":
+            old_pos = self.player.get_position()
+            if self.player.move(dx, dy, self.level_grid):
+                # Remember the first vacated tile so render can repaint just
+                # the two affected tiles when the camera holds still
+                if self._moved_from is None:
+                    self._moved_from = old_pos
+                self._player_pos = self.player.get_position()
+                self._dirty = True
 
     def selection_menu(self) -> None:
         """
         Game behavior during the selection menu screen.
         """
+        # First call pays the LLM-stack import cost; repeats hit sys.modules.
+        from src.user_input import (  # pylint: disable=import-outside-toplevel
+            verify_config_mission,
+            get_user_input,
+            place_mission_objectives,
+        )
+
         self.config = get_user_input()
 
         try:
             if "mission" in self.config:
                 self.config = verify_config_mission(self.config)
 
-            self.level_grid = generate_level(self.config)
+            self.level_grid = _get_level(self.config)
             self.config = place_mission_objectives(self.config, self.level_grid)
 
             # Initialize player at the LLM-provided start position
             start_x, start_y = self.config['start_position']
             self.player = Player(start_x, start_y, TILE_SIZE)
+            self._player_pos = (start_x, start_y)
         except KeyError as e:
             print(f"Error: Missing key in config JSON: {e}")
             return None
@@ -162,13 +351,32 @@ class Game:
 
         self.game_state = "game"
         self._game_renderer = Renderer(WINDOW_WIDTH, WINDOW_HEIGHT)
+        self._game_renderer.preload_tiles()
+        # Pre-render the static tile grid once; per-frame draws just blit it
+        self._game_renderer.bake_level_surface(self.level_grid)
+        self._dirty = True
+        self._full_redraw = True
 
     def update(self) -> None:
         """
         Update game characters after capturing user inputs.
-        Movement is now handled in on_event() for event-based input.
+
+        Movement reads the key bitmap via pygame.key.get_pressed() instead of
+        reacting to KEYDOWN events: held arrows step smoothly at the cooldown
+        rate rather than at the OS autorepeat rate, and on_event only has to
+        dispatch the rare action keys.
         """
-        pass
+        if self.player is None or self.game_state != "game":
+            return
+        now = time.monotonic_ns()
+        if now < self._next_move_ns:
+            return
+        keys = pygame.key.get_pressed()
+        dx = keys[_K_RIGHT] - keys[_K_LEFT]
+        dy = keys[_K_DOWN] - keys[_K_UP]
+        if dx or dy:
+            self._on_move(dx, dy)
+            self._next_move_ns = now + self._MOVE_COOLDOWN_NS
 
     def render(self) -> None:
         """
@@ -178,6 +386,9 @@ class Game:
         """
         if not self.running:
             return
+        if not self._dirty:
+            # Nothing changed since the last frame; keep the current buffer.
+            return
         if self.game_state == "start_menu":
             self._game_renderer.draw_start_menu()
         elif self.game_state == "selection_menu":
@@ -186,12 +397,37 @@ class Game:
             # self.game_renderer.draw_game_over_screen()
             pass
         else:
-            player_pos = self.player.get_position() if self.player else None
+            player_pos = self._player_pos
             # Update camera to follow player
+            camera_moved = True
             if player_pos is not None:
-                self._game_renderer.camera.center_on(player_pos[0], player_pos[1])
-            self._game_renderer.draw_level(self.level_grid, player_pos)
+                camera = self._game_renderer.camera
+                old_cam = (camera.x, camera.y)
+                camera.center_on(player_pos[0], player_pos[1])
+                camera_moved = (camera.x, camera.y) != old_cam
+            if (
+                player_pos is not None
+                and self._moved_from is not None
+                and not camera_moved
+                and not self._full_redraw
+            ):
+                # Only the player moved and the camera held still: repaint
+                # just the vacated and entered tiles
+                dirty_rects = self._game_renderer.draw_level_incremental(
+                    self.level_grid, self._moved_from, player_pos
+                )
+            else:
+                dirty_rects = self._game_renderer.draw_level(
+                    self.level_grid, player_pos
+                )
+            # Upload only the rects that changed instead of the whole buffer
+            pygame.display.update(dirty_rects)
+            self._dirty = False
+            self._full_redraw = False
+            self._moved_from = None
+            return
         pygame.display.flip()  # Update the full screen
+        self._dirty = False
 
     def on_cleanup(self) -> None:
         """Quits Pygame."""
@@ -14,6 +14,7 @@ input "a dark, claustrophobic dungeon" might yield the following JSON:
 import os
 import locale
 import json
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
 import traceback
@@ -22,6 +23,7 @@ from typing import (
     Any,
 )  # for type-hinting. Also necessary for Pydantic model schema validation
 
+import orjson
 from ollama import ChatResponse, ListResponse, chat, list as ollama_list  # type: ignore
 from pydantic import BaseModel
 from pydantic import Field as PydanticField
@@ -29,6 +31,9 @@ from pydantic import Field as PydanticField
 # Default model - can be overridden by environment variable
 DEFAULT_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
 
+# Process-wide constant; avoids a locale lookup on every log write
+_ENCODING = locale.getencoding()
+
 
 class DrunkardParams(BaseModel):
     """Parameters specific to the Drunkard's Walk algorithm."""
@@ -180,28 +185,6 @@ class Mission(BaseModel):
     description: str = PydanticField(description="Brief mission narrative")
 
 
-class RoomPlacementConfig(BaseModel):
-    """Configuration for random room placement algorithm."""
-
-    algorithm: Literal["random_room_placement"] = PydanticField(
-        default="random_room_placement"
-    )
-    layout: RandomRoomPlacementLayout
-    content: Content
-    aesthetic: Aesthetic
-    mission: Mission
-
-
-class DrunkardWalkConfig(BaseModel):
-    """Configuration for drunkard's walk algorithm."""
-
-    algorithm: Literal["drunkards_walk"] = PydanticField(default="drunkards_walk")
-    layout: DrunkardWalkLayout
-    content: Content
-    aesthetic: Aesthetic
-    mission: Mission
-
-
 class RandomRoomConfig(BaseModel):
     """Complete configuration returned by LLM for random room placement algorithm."""
 
@@ -277,6 +260,166 @@ LevelConfig = (
 )
 
 
+class AlgorithmReasoning(BaseModel):
+    """LLM's reasoning for algorithm choice."""
+
+    chosen_algorithm: Literal[
+        "random_room_placement",
+        "bsp",
+        "drunkards_walk",
+        "cellular_automata",
+        "hybrid_rooms_caves",
+        "cellular_rooms",
+    ]
+    reason: str = PydanticField(
+        description="Why this algorithm fits the user's request"
+    )
+
+
+# JSON schemas built once at import; Pydantic v2 schema generation walks the
+# whole model tree, so regenerating these per generate_level_config call is
+# pure repeated work.
+_SCHEMA_CACHE: dict[str, dict[str, Any]] = {
+    cls.__name__: cls.model_json_schema()
+    for cls in (
+        AlgorithmReasoning,
+        RandomRoomConfig,
+        BSPConfig,
+        DrunkardConfig,
+        CellularAutomataConfig,
+        HybridRoomsCavesConfig,
+        CellularRoomsConfig,
+    )
+}
+
+# Algorithm name -> config class, shared by every call instead of being
+# rebuilt per request
+_SCHEMA_MAP: dict[str, type[BaseModel]] = {
+    "random_room_placement": RandomRoomConfig,
+    "bsp": BSPConfig,
+    "drunkards_walk": DrunkardConfig,
+    "cellular_automata": CellularAutomataConfig,
+    "hybrid_rooms_caves": HybridRoomsCavesConfig,
+    "cellular_rooms": CellularRoomsConfig,
+}
+
+# Canonical JSON form of each schema, hashable for the chat memo below
+_SCHEMA_JSON: dict[str, str] = {
+    name: json.dumps(schema, sort_keys=True)
+    for name, schema in _SCHEMA_CACHE.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _cached_chat(model: str, prompt: str, schema_json: str) -> str:
+    """Run a schema-constrained chat() call, memoized on its inputs.
+
+    The two Ollama round-trips dominate generate_level_config's runtime;
+    repeating the exact same (model, prompt, schema) triple returns the
+    prior response straight from memory. The response is consumed as a
+    stream so accumulation overlaps generation instead of waiting on the
+    final token before any bytes move. Empty responses raise instead of
+    returning so failures are never cached.
+    """
+    parts: list[str] = []
+    chunk: ChatResponse
+    for chunk in chat(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        format=json.loads(schema_json),
+        stream=True,
+    ):
+        if chunk.message.content:
+            parts.append(chunk.message.content)
+        if chunk.done:
+            break
+    content = "".join(parts)
+    if not content:
+        raise ValueError("LLM returned empty response")
+    return content
+
+
+# Prompt bodies built once at import; per call only the small
+# substitutions are formatted in, not the multi-KB template text.
+_ALGO_PROMPT_TMPL = """You are a roguelike level designer. Analyze this
+        request and choose the BEST algorithm.
+
+USER REQUEST: "{user_prompt}"
+
+AVAILABLE ALGORITHMS (all equally good - choose based on specific keywords):
+1. random_room_placement: Rectangular rooms + corridors. Best for: "dungeon", "temple", "structured"
+2. bsp: Hierarchical organized rooms. Best for: "fortress", "military", "castle", "organized"
+3. drunkards_walk: Winding narrow tunnels. Best for: "maze", "cramped", "twisting". NOT for: "boss", "lair", "arena"
+4. cellular_automata: Organic flowing caves. Best for: "cave", "natural", "grotto", "underground"
+5. hybrid_rooms_caves: Rooms + tunnels mix. Best for: "variety", "mixed", "citadel"
+6. cellular_rooms: Large battle halls. Best for: "arena", "pit", "chamber", "fighting"
+
+IMPORTANT RULES:
+1. Match EXACT keywords to algorithms (e.g., "maze"→drunkards_walk, "cave"→cellular_automata, "fortress"→bsp)
+2. For "boss", "lair", "dragon": Choose random_room_placement OR cellular_rooms (NOT drunkards_walk - too narrow!)
+3. For generic prompts with NO specific keywords: Pick randomly among random_room_placement, bsp, cellular_automata, cellular_rooms
+4. Don't over-use hybrid_rooms_caves - it's not always the best choice!
+
+Choose ONE algorithm and explain why in 1-2 sentences."""
+
+_PARAM_PROMPT_TMPL = """You are a roguelike level designer. The user described a SETTING/ATMOSPHERE.
+Your job: INVENT a fitting mission for that setting, then generate parameters.
+
+USER'S SETTING DESCRIPTION: "{user_prompt}"
+CHOSEN ALGORITHM: {chosen_algo}
+
+STEP 1 - INVENT A MISSION THAT FITS THE SETTING:
+
+Based on the atmosphere/description, what mission makes sense?
+- "dragon's lair" → linear_progression with boss fight
+- "sprawling caves" → exploration to find treasures
+- "crumbling ruins" → survival/escape mission
+- "guarded vault" → key_hunt to unlock treasure
+- "arena chambers" → multi_objective combat challenges
+- "mysterious catacombs" → exploration to discover secrets
+
+Mission Types:
+- linear_progression: Clear path to climactic boss encounter
+- exploration: Discover scattered rewards/secrets
+- key_hunt: Find keys to unlock final area
+- survival: Navigate dangers to reach safe zones
+- multi_objective: Multiple different goals
+
+STEP 2 - DESIGN OBJECTIVES (1-6) FOR YOUR MISSION:
+
+Objective types: boss, treasure, key, safe_room, puzzle, miniboss, secret
+
+Placement rules:
+- end_of_longest_path: Furthest from start (perfect for final boss)
+- dead_end: In branch paths (perfect for treasure/secrets)
+- central_room: In largest room (perfect for miniboss/puzzle)
+- hidden: Hard to find (perfect for secrets)
+- checkpoint: Midway through (perfect for safe rooms)
+- random_room: Any suitable location
+
+Examples:
+- Dragon's lair → linear_progression: [boss at end, treasure in dead_ends, puzzle in central]
+- Sprawling caves → exploration: [5 treasures in hidden/dead_end locations]
+- Crumbling ruins → survival: [3 safe_rooms at checkpoints, 1 key for exit]
+- Guarded vault → key_hunt: [2 keys in dead_ends, treasure at end]
+
+STEP 3 - SET PARAMETERS:
+
+Map Size: width=50-60, height=35-45
+Densities: enemy=0.05-0.15, treasure=0.03-0.10, trap=0.01-0.05
+Lighting: 0.0=dark, 0.5=dim, 1.0=bright (match atmosphere!)
+Room algorithms: max_rooms=10-20, room_size_min=4-8, room_size_max=8-15
+Drunkard's walk: target_floor_percent=0.22-0.35, straight_bias=0.6-0.8
+Cellular: initial_wall_probability=0.45-0.55, iterations=3-5
+
+IMPORTANT: 
+- INVENT a mission that fits the setting's mood/atmosphere
+- Be creative with objectives and their placement
+- Match lighting and parameters to the setting's feel
+
+Return ONLY valid JSON matching the schema for {chosen_algo}."""
+
+
 def get_available_models() -> list[str]:
     """
     Get list of available Ollama models on the local system.
@@ -369,140 +512,46 @@ def generate_level_config(
         tuple: (config, log_data) where log_data contains prompt, response, thinking, etc.
     """
 
-    # Step 1: LLM chooses the best algorithm
-    class AlgorithmReasoning(BaseModel):
-        """LLM's reasoning for algorithm choice."""
-
-        chosen_algorithm: Literal[
-            "random_room_placement",
-            "bsp",
-            "drunkards_walk",
-            "cellular_automata",
-            "hybrid_rooms_caves",
-            "cellular_rooms",
-        ]
-        reason: str = PydanticField(
-            description="Why this algorithm fits the user's request"
+    # Step 1: LLM chooses the best algorithm. When the caller already named
+    # a valid one, skip the selection round-trip entirely — it is half the
+    # end-to-end latency.
+    if prefer_algorithm and prefer_algorithm in _SCHEMA_MAP:
+        algo_prompt = ""
+        reasoning = AlgorithmReasoning(
+            chosen_algorithm=prefer_algorithm,  # type: ignore[arg-type]
+            reason="user-specified",
         )
+    else:
+        algo_prompt = _ALGO_PROMPT_TMPL.format(user_prompt=user_prompt)
 
-    algo_prompt = f"""You are a roguelike level designer. Analyze this
-        request and choose the BEST algorithm.
-
-USER REQUEST: "{user_prompt}"
-
-AVAILABLE ALGORITHMS (all equally good - choose based on specific keywords):
-1. random_room_placement: Rectangular rooms + corridors. Best for: "dungeon", "temple", "structured"
-2. bsp: Hierarchical organized rooms. Best for: "fortress", "military", "castle", "organized"
-3. drunkards_walk: Winding narrow tunnels. Best for: "maze", "cramped", "twisting". NOT for: "boss", "lair", "arena"
-4. cellular_automata: Organic flowing caves. Best for: "cave", "natural", "grotto", "underground"
-5. hybrid_rooms_caves: Rooms + tunnels mix. Best for: "variety", "mixed", "citadel"
-6. cellular_rooms: Large battle halls. Best for: "arena", "pit", "chamber", "fighting"
+        if prefer_algorithm:
+            algo_prompt += (
+                f"\nThe user prefers to use {prefer_algorithm} as the algorithm."
+            )
 
-IMPORTANT RULES:
-1. Match EXACT keywords to algorithms (e.g., "maze"→drunkards_walk, "cave"→cellular_automata, "fortress"→bsp)
-2. For "boss", "lair", "dragon": Choose random_room_placement OR cellular_rooms (NOT drunkards_walk - too narrow!)
-3. For generic prompts with NO specific keywords: Pick randomly among random_room_placement, bsp, cellular_automata, cellular_rooms
-4. Don't over-use hybrid_rooms_caves - it's not always the best choice!
-
-Choose ONE algorithm and explain why in 1-2 sentences."""
-
-    if prefer_algorithm:
-        algo_prompt += "\nThe user prefers to use ${prefer_algorithm} as the algorithm."
-
-    algo_response = chat(
-        model=model,
-        messages=[{"role": "user", "content": algo_prompt}],
-        format=AlgorithmReasoning.model_json_schema(),
-    )
-
-    if not algo_response.message.content:
-        raise ValueError("LLM returned empty algorithm reasoning")
+        algo_content = _cached_chat(
+            model, algo_prompt, _SCHEMA_JSON["AlgorithmReasoning"]
+        )
 
-    reasoning = AlgorithmReasoning.model_validate_json(algo_response.message.content)
+        # orjson pre-parses the small reasoning payload faster than Pydantic's
+        # string path; validate_python then just checks the two fields
+        reasoning = AlgorithmReasoning.model_validate(orjson.loads(algo_content))
     chosen_algo = reasoning.chosen_algorithm
 
     # Step 2: Generate parameters AND mission design for chosen algorithm
-    param_prompt = f"""You are a roguelike level designer. The user described a SETTING/ATMOSPHERE.
-Your job: INVENT a fitting mission for that setting, then generate parameters.
-
-USER'S SETTING DESCRIPTION: "{user_prompt}"
-CHOSEN ALGORITHM: {chosen_algo}
-
-STEP 1 - INVENT A MISSION THAT FITS THE SETTING:
-
-Based on the atmosphere/description, what mission makes sense?
-- "dragon's lair" → linear_progression with boss fight
-- "sprawling caves" → exploration to find treasures
-- "crumbling ruins" → survival/escape mission
-- "guarded vault" → key_hunt to unlock treasure
-- "arena chambers" → multi_objective combat challenges
-- "mysterious catacombs" → exploration to discover secrets
-
-Mission Types:
-- linear_progression: Clear path to climactic boss encounter
-- exploration: Discover scattered rewards/secrets
-- key_hunt: Find keys to unlock final area
-- survival: Navigate dangers to reach safe zones
-- multi_objective: Multiple different goals
-
-STEP 2 - DESIGN OBJECTIVES (1-6) FOR YOUR MISSION:
-
-Objective types: boss, treasure, key, safe_room, puzzle, miniboss, secret
-
-Placement rules:
-- end_of_longest_path: Furthest from start (perfect for final boss)
-- dead_end: In branch paths (perfect for treasure/secrets)
-- central_room: In largest room (perfect for miniboss/puzzle)
-- hidden: Hard to find (perfect for secrets)
-- checkpoint: Midway through (perfect for safe rooms)
-- random_room: Any suitable location
-
-Examples:
-- Dragon's lair → linear_progression: [boss at end, treasure in dead_ends, puzzle in central]
-- Sprawling caves → exploration: [5 treasures in hidden/dead_end locations]
-- Crumbling ruins → survival: [3 safe_rooms at checkpoints, 1 key for exit]
-- Guarded vault → key_hunt: [2 keys in dead_ends, treasure at end]
-
-STEP 3 - SET PARAMETERS:
-
-Map Size: width=50-60, height=35-45
-Densities: enemy=0.05-0.15, treasure=0.03-0.10, trap=0.01-0.05
-Lighting: 0.0=dark, 0.5=dim, 1.0=bright (match atmosphere!)
-Room algorithms: max_rooms=10-20, room_size_min=4-8, room_size_max=8-15
-Drunkard's walk: target_floor_percent=0.22-0.35, straight_bias=0.6-0.8
-Cellular: initial_wall_probability=0.45-0.55, iterations=3-5
-
-IMPORTANT: 
-- INVENT a mission that fits the setting's mood/atmosphere
-- Be creative with objectives and their placement
-- Match lighting and parameters to the setting's feel
-
-Return ONLY valid JSON matching the schema for {chosen_algo}."""
+    param_prompt = _PARAM_PROMPT_TMPL.format(
+        user_prompt=user_prompt, chosen_algo=chosen_algo
+    )
 
     # Select the appropriate config schema
-    schema_map: dict[str, Any] = {
-        "random_room_placement": RandomRoomConfig,
-        "bsp": BSPConfig,
-        "drunkards_walk": DrunkardConfig,
-        "cellular_automata": CellularAutomataConfig,
-        "hybrid_rooms_caves": HybridRoomsCavesConfig,
-        "cellular_rooms": CellularRoomsConfig,
-    }
-
-    config_schema: LevelConfig = schema_map[chosen_algo]
+    config_schema = _SCHEMA_MAP[chosen_algo]
 
-    param_response: ChatResponse = chat(
-        model=model,
-        messages=[{"role": "user", "content": param_prompt}],
-        format=config_schema.model_json_schema(),
+    param_content = _cached_chat(
+        model, param_prompt, _SCHEMA_JSON[config_schema.__name__]
     )
 
-    if not param_response.message.content:
-        raise ValueError("LLM returned empty parameters")
-
-    config: LevelConfig = config_schema.model_validate_json(
-        param_response.message.content
-    )
+    # bytes input lets pydantic-core skip a UTF-8 re-encode of the payload
+    config: LevelConfig = config_schema.model_validate_json(param_content.encode())
 
     # Build log data
     log_data: dict[str, Any] = {
@@ -512,7 +561,7 @@ Return ONLY valid JSON matching the schema for {chosen_algo}."""
         "reasoning": reasoning.reason,
         "algo_prompt": algo_prompt,
         "param_prompt": param_prompt,
-        "response_content": param_response.message.content,
+        "response_content": param_content,
         "config": config.model_dump(),  # type: ignore
     }
 
@@ -523,7 +572,7 @@ Return ONLY valid JSON matching the schema for {chosen_algo}."""
         log_dir.mkdir(exist_ok=True)
 
         log_file = log_dir / f"llm_generation_{timestamp}.json"
-        with open(log_file, "w", encoding=locale.getencoding()) as file:
+        with open(log_file, "w", encoding=_ENCODING) as file:
             json.dump(log_data, file, indent=2)
 
         print(f"Saved log to {log_file}")
@@ -5,62 +5,119 @@ Mission processor - places objectives in generated levels according to mission d
 from typing import Any
 import random
 
+import numpy as np
+
 
 TILE_WALL = 0
 TILE_FLOOR = 1
 
 
+class GridIndex:
+    """Per-grid structural analyses shared across the placement rules.
+
+    place_objectives needs the rooms, the dead ends and (indirectly) the
+    ndarray view of the same grid; building them through the module-level
+    functions would re-pay the list-to-ndarray conversion for each one.
+    This bundles one conversion with one scan per analysis.
+    """
+
+    __slots__ = ("arr", "rooms", "dead_ends")
+
+    def __init__(self, grid: list[list[int]]) -> None:
+        self.arr: np.ndarray = np.asarray(grid, dtype=np.uint8)
+        self.rooms: list[dict[str, Any]] = _find_rooms(self.arr)
+        self.dead_ends: list[tuple[int, int]] = _find_dead_ends(self.arr)
+
+    def distances_from(
+        self, start_pos: tuple[int, int]
+    ) -> dict[tuple[int, int], int]:
+        """BFS distances from start_pos (start-dependent, so not cached)."""
+        return _calculate_distances(self.arr, start_pos)
+
+
 def find_rooms(grid: list[list[int]]) -> list[dict[str, Any]]:
     """
     Find distinct rooms in the level using flood fill.
     Returns list of rooms with their properties.
     """
-    height: int = len(grid)
-    width: int = len(grid[0])
-    visited: list[list[bool]] = [[False] * width for _ in range(height)]
+    return _find_rooms(np.asarray(grid, dtype=np.uint8))
+
+
+def _find_rooms(arr: np.ndarray) -> list[dict[str, Any]]:
+    # The fill below runs over a flat bytes buffer — one contiguous
+    # allocation indexed as y*width+x, so each access is a single byte load
+    # instead of two nested-list dereferences. visited is a bytearray of the
+    # same shape.
+    height, width = arr.shape
+    size = height * width
+    flat = arr.tobytes()
+    visited = bytearray(size)
     rooms: list[Any] = []
 
-    def flood_fill(start_x: int, start_y: int) -> list[tuple[int, int]]:
-        """Flood fill to find connected floor tiles."""
-        tiles: list[tuple[int,int]] = []
-        stack: list[tuple[int, int]] = [(start_x, start_y)]
+    def flood_fill(start: int) -> list[int]:
+        """Flood fill to find connected floor tiles (flat indices)."""
+        visited[start] = 1
+        tiles: list[int] = [start]
+        stack: list[int] = [start]
 
         while stack:
-            x,y  = stack.pop()
-            if x < 0 or x >= width or y < 0 or y >= height:
-                continue
-            if visited[y][x] or grid[y][x] == TILE_WALL:
-                continue
-
-            visited[y][x] = True
-            tiles.append((x, y))
-
-            # Add neighbors
-            stack.extend([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
+            idx = stack.pop()
+            x = idx % width
+            # Validate each neighbor before pushing: the old push-then-reject
+            # pattern put every tile on the stack up to four times and paid a
+            # pop plus three failed checks to throw the duplicates away.
+            if x + 1 < width:
+                n = idx + 1
+                if not visited[n] and flat[n] != TILE_WALL:
+                    visited[n] = 1
+                    tiles.append(n)
+                    stack.append(n)
+            if x > 0:
+                n = idx - 1
+                if not visited[n] and flat[n] != TILE_WALL:
+                    visited[n] = 1
+                    tiles.append(n)
+                    stack.append(n)
+            n = idx + width
+            if n < size and not visited[n] and flat[n] != TILE_WALL:
+                visited[n] = 1
+                tiles.append(n)
+                stack.append(n)
+            n = idx - width
+            if n >= 0 and not visited[n] and flat[n] != TILE_WALL:
+                visited[n] = 1
+                tiles.append(n)
+                stack.append(n)
 
         return tiles
 
     # Find all rooms
-    for y in range(height):
-        for x in range(width):
-            if grid[y][x] == TILE_FLOOR and not visited[y][x]:
-                tiles = flood_fill(x, y)
-                if len(tiles) >= 4:  # Minimum room size
-                    # Calculate room center
-                    avg_x = sum(t[0] for t in tiles) / len(tiles)
-                    avg_y = sum(t[1] for t in tiles) / len(tiles)
-
-                    rooms.append(
-                        {
-                            "tiles": tiles,
-                            "size": len(tiles),
-                            "center": (int(avg_x), int(avg_y)),
-                            "min_x": min(t[0] for t in tiles),
-                            "max_x": max(t[0] for t in tiles),
-                            "min_y": min(t[1] for t in tiles),
-                            "max_y": max(t[1] for t in tiles),
-                        }
-                    )
+    for idx in range(size):
+        if flat[idx] == TILE_FLOOR and not visited[idx]:
+            flat_tiles = flood_fill(idx)
+            if len(flat_tiles) >= 4:  # Minimum room size
+                # Centroid and bounding box in a few C-level passes over
+                # one int32 array instead of six generator traversals
+                indices = np.asarray(flat_tiles, dtype=np.int32)
+                xs = indices % width
+                ys = indices // width
+
+                room_tiles = list(zip(xs.tolist(), ys.tolist()))
+                rooms.append(
+                    {
+                        "tiles": room_tiles,
+                        # Immutable packed (y*width+x) set view: single-int
+                        # hashing makes the set differences in objective
+                        # placement much cheaper than tuple keys
+                        "tiles_flat": frozenset(flat_tiles),
+                        "size": len(flat_tiles),
+                        "center": (int(xs.mean()), int(ys.mean())),
+                        "min_x": int(xs.min()),
+                        "max_x": int(xs.max()),
+                        "min_y": int(ys.min()),
+                        "max_y": int(ys.max()),
+                    }
+                )
 
     return rooms
 
@@ -72,51 +129,70 @@ def calculate_distances_from_start(
     Calculate distances from start position to all reachable floor tiles using BFS.
     Returns dict mapping (x,y) -> distance.
     """
-    height: int = len(grid)
-    width: int = len(grid[0])
-    distances = {}
-    queue = [(start_pos, 0)]
-    visited: set[tuple[int,int]] = set()
+    return _calculate_distances(np.asarray(grid, dtype=np.uint8), start_pos)
 
-    while queue:
-        (x, y), dist = queue.pop(0)
 
-        if (x, y) in visited:
-            continue
-        if x < 0 or x >= width or y < 0 or y >= height:
-            continue
-        if grid[y][x] == TILE_WALL:
-            continue
+def _calculate_distances(
+    arr: np.ndarray, start_pos: tuple[int, int]
+) -> dict[tuple[int, int], int]:
+    dist = _distance_array(arr, start_pos)
+    ys, xs = np.nonzero(dist >= 0)
+    values = dist[ys, xs]
+    return {
+        (x, y): v
+        for x, y, v in zip(xs.tolist(), ys.tolist(), values.tolist())
+    }
 
-        visited.add((x, y))
-        distances[(x, y)] = dist
 
-        # Add neighbors
-        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-            queue.append(((x + dx, y + dy), dist + 1))
+def _distance_array(arr: np.ndarray, start_pos: tuple[int, int]) -> np.ndarray:
+    """BFS distance per cell as an int32 array; -1 marks unreachable."""
+    # Vectorized frontier expansion: each BFS layer is one set of shifted
+    # boolean masks at C speed instead of per-tile Python queue traffic.
+    floor = arr != TILE_WALL
+    start_x, start_y = start_pos
+    dist = np.full(arr.shape, -1, dtype=np.int32)
+    if not floor[start_y, start_x]:
+        return dist
+    dist[start_y, start_x] = 0
+    frontier = np.zeros(arr.shape, dtype=bool)
+    frontier[start_y, start_x] = True
+
+    layer = 0
+    while True:
+        layer += 1
+        spread = np.zeros_like(frontier)
+        spread[1:, :] |= frontier[:-1, :]
+        spread[:-1, :] |= frontier[1:, :]
+        spread[:, 1:] |= frontier[:, :-1]
+        spread[:, :-1] |= frontier[:, 1:]
+        spread &= floor
+        spread &= dist < 0
+        if not spread.any():
+            break
+        dist[spread] = layer
+        frontier = spread
 
-    return distances
+    return dist
 
 
 def find_dead_ends(grid: list[list[int]]) -> list[tuple[int, int]]:
     """Find dead-end locations (floor tiles with only one floor neighbor)."""
-    height: int = len(grid)
-    width: int = len(grid[0])
-    dead_ends: list[tuple[int,int]] = []
-
-    for y in range(1, height - 1):
-        for x in range(1, width - 1):
-            if grid[y][x] == TILE_FLOOR:
-                # Count floor neighbors
-                neighbors = 0
-                for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                    if grid[y + dy][x + dx] == TILE_FLOOR:
-                        neighbors += 1
+    return _find_dead_ends(np.asarray(grid, dtype=np.uint8))
 
-                if neighbors == 1:  # Dead end
-                    dead_ends.append((x, y))
 
-    return dead_ends
+def _find_dead_ends(arr: np.ndarray) -> list[tuple[int, int]]:
+    # Neighbor counts for all interior cells at once via shifted slices —
+    # one vectorized pass instead of a four-probe Python loop per cell.
+    floor = (arr == TILE_FLOOR).astype(np.uint8)
+    neighbor_count = (
+        floor[1:-1, 2:]
+        + floor[1:-1, :-2]
+        + floor[2:, 1:-1]
+        + floor[:-2, 1:-1]
+    )
+    ys, xs = np.nonzero((neighbor_count == 1) & (floor[1:-1, 1:-1] == 1))
+    # +1 restores interior offsets to full-grid coordinates
+    return list(zip((xs + 1).tolist(), (ys + 1).tolist()))
 
 
 def place_objectives(grid: list[list[int]], mission: dict[str, Any]) -> dict[str, Any]:
@@ -124,26 +200,21 @@ def place_objectives(grid: list[list[int]], mission: dict[str, Any]) -> dict[str
     Place objectives in the level according to mission design.
     Returns dict with objective placements and metadata.
     """
-    height = len(grid)
-    width = len(grid[0])
-
-    # Find start position (first floor tile from top-left)
-    start_pos = None
-    for y in range(height):
-        for x in range(width):
-            if grid[y][x] == TILE_FLOOR:
-                start_pos = (x, y)
-                break
-        if start_pos:
-            break
-
-    if not start_pos:
+    # One conversion + one pass per analysis, shared by every rule below
+    index = GridIndex(grid)
+    arr = index.arr
+    height, width = arr.shape
+
+    # Find start position (first floor tile from top-left): argmax over the
+    # flattened floor mask short-circuits at the first True at C speed
+    floor_flat = (arr == TILE_FLOOR).ravel()
+    if not floor_flat.any():
         return {"error": "No floor tiles found", "placements": []}
+    first_floor = int(floor_flat.argmax())
+    start_pos = (first_floor % width, first_floor // width)
 
-    # Analyze level structure
-    rooms = find_rooms(grid)
-    distances = calculate_distances_from_start(grid, start_pos)
-    dead_ends = find_dead_ends(grid)
+    rooms = index.rooms
+    dead_ends = index.dead_ends
 
     if not rooms:
         return {"error": "No rooms found", "placements": []}
@@ -151,11 +222,119 @@ def place_objectives(grid: list[list[int]], mission: dict[str, Any]) -> dict[str
     # Sort rooms by size for easy access
     rooms_by_size = sorted(rooms, key=lambda r: r["size"], reverse=True)
 
-    # Find furthest points
-    furthest_tiles = sorted(distances.items(), key=lambda item: item[1], reverse=True)
+    # All positions below are packed flat ints (y*width+x): one PyLong hash
+    # per set probe instead of a tuple plus two. Tuples reappear only at the
+    # placement-dict boundary.
+    dist = _distance_array(arr, start_pos).ravel()
+    reachable = dist >= 0
+
+    # Grid-dependent analyses hoisted out of the objective loop: the max
+    # distance, the checkpoint midpoint and the corner tiles are fixed for a
+    # given grid, and the furthest-tile ordering is only built if some
+    # objective actually asks for it.
+    max_distance = int(dist.max()) if reachable.any() else 0
+    mid_distance = max_distance // 2
+
+    # Corner tiles (2+ wall neighbors): one shifted-slice neighbor-count
+    # pass over the whole grid, then intersected with room tiles so
+    # fragments below the minimum room size stay excluded
+    wall = (arr == TILE_WALL).astype(np.uint8)
+    wall_neighbors = np.zeros_like(wall)
+    wall_neighbors[1:-1, 1:-1] = (
+        wall[1:-1, 2:] + wall[1:-1, :-2] + wall[2:, 1:-1] + wall[:-2, 1:-1]
+    )
+    corner_ys, corner_xs = np.nonzero((wall_neighbors >= 2) & (arr == TILE_FLOOR))
+    corners = set((corner_ys * width + corner_xs).tolist())
+    corners &= set().union(*(room["tiles_flat"] for room in rooms))
+
+    dead_ends_set = {y * width + x for x, y in dead_ends}
+
+    furthest_order: list[int] | None = None
+
+    # Checkpoint band is grid-invariant too; used positions drop out at
+    # pick time via set difference
+    checkpoint_band = set(
+        np.nonzero(reachable & (np.abs(dist - mid_distance) < 5))[0].tolist()
+    )
 
     placements = []
-    used_positions = set()
+    used_positions: set[int] = set()
+
+    def pick_end_of_longest_path(k: int) -> list[int]:
+        """The k furthest unused reachable tiles."""
+        nonlocal furthest_order
+        if furthest_order is None:
+            # Stable sort on -dist: descending distance, row-major ties;
+            # unreachable (-1) cells sort to the tail
+            furthest_order = np.argsort(-dist, kind="stable").tolist()
+        picks: list[int] = []
+        for idx in furthest_order:
+            if not reachable[idx]:
+                break
+            if idx not in used_positions and idx not in picks:
+                picks.append(idx)
+                if len(picks) == k:
+                    break
+        return picks
+
+    def pick_dead_end(k: int) -> list[int]:
+        """Up to k distinct unused dead ends."""
+        available = dead_ends_set - used_positions
+        return random.sample(tuple(available), min(k, len(available)))
+
+    def pick_central_room(k: int) -> list[int]:
+        """Free tiles from the largest rooms with space left."""
+        picks: list[int] = []
+        taken: set[int] = set()
+        for _ in range(k):
+            # Re-evaluated per pick: a room can fill up mid-draw
+            for room in rooms_by_size:
+                candidates = room["tiles_flat"] - used_positions - taken
+                if candidates:
+                    idx = random.choice(tuple(candidates))
+                    picks.append(idx)
+                    taken.add(idx)
+                    break
+        return picks
+
+    def pick_hidden(k: int) -> list[int]:
+        """Up to k distinct unused corner tiles."""
+        available = corners - used_positions
+        return random.sample(tuple(available), min(k, len(available)))
+
+    def pick_checkpoint(k: int) -> list[int]:
+        """Up to k distinct unused tiles near the midpoint distance."""
+        available = checkpoint_band - used_positions
+        return random.sample(tuple(available), min(k, len(available)))
+
+    def pick_random_room(k: int) -> list[int]:
+        """Free tiles from uniformly chosen rooms with space left."""
+        picks: list[int] = []
+        taken: set[int] = set()
+        for _ in range(k):
+            room_pools = [
+                pool
+                for r in rooms
+                if (pool := r["tiles_flat"] - used_positions - taken)
+            ]
+            if not room_pools:
+                break
+            idx = random.choice(tuple(random.choice(room_pools)))
+            picks.append(idx)
+            taken.add(idx)
+        return picks
+
+    # Rule name -> picker; one dict lookup per objective instead of an
+    # elif ladder of string comparisons. Each picker draws the objective's
+    # whole count in one pass.
+    rule_handlers = {
+        "end_of_longest_path": pick_end_of_longest_path,
+        "dead_end": pick_dead_end,
+        "central_room": pick_central_room,
+        "hidden": pick_hidden,
+        "checkpoint": pick_checkpoint,
+        "random_room": pick_random_room,
+    }
 
     # Process each objective
     for obj in mission.get("objectives", []):
@@ -163,89 +342,21 @@ def place_objectives(grid: list[list[int]], mission: dict[str, Any]) -> dict[str
         placement_rule = obj["placement_rule"]
         count = obj["count"]
         description = obj["description"]
+        handler = rule_handlers.get(placement_rule)
+        if handler is None:
+            continue
 
-        for i in range(count): # type: ignore
-            position = None
-
-            if placement_rule == "end_of_longest_path":
-                # Place at furthest reachable point
-                for (x, y), dist in furthest_tiles:
-                    if (x, y) not in used_positions:
-                        position = (x, y)
-                        used_positions.add(position)
-                        break
-
-            elif placement_rule == "dead_end":
-                # Place in dead ends
-                available_dead_ends = [
-                    de for de in dead_ends if de not in used_positions
-                ]
-                if available_dead_ends:
-                    position = random.choice(available_dead_ends)
-                    used_positions.add(position)
-
-            elif placement_rule == "central_room":
-                # Place in largest room
-                for room in rooms_by_size:
-                    candidates = [t for t in room["tiles"] if t not in used_positions]
-                    if candidates:
-                        position = random.choice(candidates)
-                        used_positions.add(position)
-                        break
-
-            elif placement_rule == "hidden":
-                # Place in corners or hard-to-see locations
-                corners = []
-                for room in rooms:
-                    # Find corner tiles (2+ wall neighbors)
-                    for x, y in room["tiles"]:
-                        if (x, y) in used_positions:
-                            continue
-                        wall_neighbors = 0
-                        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                            if grid[y + dy][x + dx] == TILE_WALL:
-                                wall_neighbors += 1
-                        if wall_neighbors >= 2:
-                            corners.append((x, y))
-
-                if corners:
-                    position = random.choice(corners)
-                    used_positions.add(position)
-
-            elif placement_rule == "checkpoint":
-                # Place at medium distance
-                mid_distance = max(distances.values()) // 2 if distances else 0
-                candidates = [
-                    (pos, dist)
-                    for pos, dist in distances.items()
-                    if abs(dist - mid_distance) < 5 and pos not in used_positions
-                ]
-                if candidates:
-                    position = random.choice(candidates)[0]
-                    used_positions.add(position)
-
-            elif placement_rule == "random_room":
-                # Random room placement
-                available_rooms = [
-                    r for r in rooms if any(t not in used_positions for t in r["tiles"])
-                ]
-                if available_rooms:
-                    room = random.choice(available_rooms)
-                    candidates = [t for t in room["tiles"] if t not in used_positions]
-                    if candidates:
-                        position = random.choice(candidates)
-                        used_positions.add(position)
-
-            # Record placement
-            if position:
-                placements.append(
-                    {
-                        "objective_type": obj_type,
-                        "position": position,
-                        "placement_rule": placement_rule,
-                        "description": description,
-                    }
-                )
+        for idx in handler(count):
+            used_positions.add(idx)
+            placements.append(
+                {
+                    "objective_type": obj_type,
+                    # Unpack to (x, y) only at the API boundary
+                    "position": (idx % width, idx // width),
+                    "placement_rule": placement_rule,
+                    "description": description,
+                }
+            )
 
     return {
         "placements": placements,
@@ -253,6 +364,6 @@ def place_objectives(grid: list[list[int]], mission: dict[str, Any]) -> dict[str
         "mission_type": mission.get("mission_type", "unknown"),
         "mission_description": mission.get("description", ""),
         "num_rooms": len(rooms),
-        "max_distance": max(distances.values()) if distances else 0,
+        "max_distance": max_distance,
         "dead_end_count": len(dead_ends),
     }
@@ -4,7 +4,262 @@ Translates mission requirements into PCG parameter adjustments.
 This ensures the generated geometry actually supports the mission design.
 """
 
+from functools import lru_cache
 from typing import Any
+from collections.abc import Callable
+
+# Room-based algorithms share every adjustment rule
+_ROOM_ALGOS = frozenset({"random_room_placement", "bsp", "hybrid_rooms_caves"})
+
+
+def _nested_params(
+    adjusted: dict[str, Any], layout: dict[str, Any], key: str
+) -> dict[str, Any]:
+    """Return the nested params dict under ``key``, copying it on first use
+    so the caller's layout is never mutated."""
+    if key not in adjusted:
+        adjusted[key] = layout.get(key, {}).copy() if key in layout else {}
+    return adjusted[key]
+
+
+# ===== LINEAR PROGRESSION =====
+def _linear_rooms(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Fewer, larger rooms with clear connections
+    adjusted["max_rooms"] = max(6, layout.get("max_rooms", 10) - 4)
+    adjusted["room_size_min"] = max(6, layout.get("room_size_min", 4) + 2)
+    adjusted["room_size_max"] = min(18, layout.get("room_size_max", 12) + 4)
+
+    if counts["needs_boss_room"]:
+        # Ensure at least one LARGE room for boss
+        adjusted["room_size_max"] = min(20, adjusted["room_size_max"] + 3)
+
+
+def _linear_drunkard(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # More winding for dramatic progression
+    adjusted["straight_bias"] = max(0.5, layout.get("straight_bias", 0.7) - 0.2)
+
+    # BOSS FIGHT SPECIAL CASE - need open area at end!
+    if counts["needs_boss_room"]:
+        # Much more open for boss arena
+        adjusted["target_floor_percent"] = min(
+            0.45, layout.get("target_floor_percent", 0.27) + 0.18
+        )
+        # Multiple drunkards converging creates larger areas
+        adjusted["num_drunkards"] = max(3, layout.get("num_drunkards", 1) + 2)
+        params = _nested_params(adjusted, layout, "drunkard_params")
+        # Force smoothing to widen corridors into chambers
+        params["smooth"] = True
+        params["add_pillars"] = True
+        # Start from center so they spread outward
+        params["start_pos"] = "center"
+    else:
+        # Normal progression - keep it interesting
+        adjusted["target_floor_percent"] = min(
+            0.30, layout.get("target_floor_percent", 0.27) + 0.03
+        )
+
+
+def _linear_cellular(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Boss needs larger connected spaces, but not one blob
+    params = _nested_params(adjusted, layout, "cellular_params")
+    params["initial_wall_probability"] = max(
+        0.48, params.get("initial_wall_probability", 0.50) - 0.02
+    )
+    params["iterations"] = params.get("iterations", 4)  # Keep standard
+
+
+# ===== EXPLORATION =====
+def _exploration_rooms(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # MORE rooms, MORE branches
+    adjusted["max_rooms"] = min(25, layout.get("max_rooms", 15) + 5)
+    adjusted["room_size_min"] = layout.get("room_size_min", 4)  # Keep varied
+    adjusted["room_size_max"] = layout.get("room_size_max", 12)  # Medium rooms
+
+    # If we need dead-ends, ensure more rooms
+    if counts["needs_dead_ends"]:
+        adjusted["max_rooms"] = min(
+            30, adjusted["max_rooms"] + counts["dead_end_count"]
+        )
+
+
+def _exploration_drunkard(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Branching caves with corridors (not too open!)
+    adjusted["target_floor_percent"] = min(
+        0.30, layout.get("target_floor_percent", 0.27) + 0.03
+    )
+    adjusted["straight_bias"] = max(0.60, layout.get("straight_bias", 0.7) - 0.10)
+
+    # Multiple drunkards create branches for treasures
+    if "num_drunkards" not in adjusted or adjusted.get("num_drunkards", 1) < 3:
+        adjusted["num_drunkards"] = min(4, 2 + (counts["dead_end_count"] // 2))
+
+
+def _exploration_cellular(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Create NETWORK topology with varied corridors
+    params = _nested_params(adjusted, layout, "cellular_params")
+    # Higher walls (0.58) + more iterations = interesting corridors
+    params["initial_wall_probability"] = min(
+        0.58, params.get("initial_wall_probability", 0.50) + 0.08
+    )
+    params["iterations"] = min(6, params.get("iterations", 4) + 2)
+    # Adjust birth/death for more varied topology
+    params["birth_limit"] = 5  # Harder to create walls
+    params["death_limit"] = 2  # Easier to remove walls
+
+
+# ===== SURVIVAL =====
+def _survival_rooms(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Medium number of safe rooms (checkpoints)
+    adjusted["max_rooms"] = max(
+        8, min(20, layout.get("max_rooms", 12) + counts["checkpoint_count"])
+    )
+    adjusted["room_size_min"] = max(5, layout.get("room_size_min", 4) + 1)
+
+
+def _survival_drunkard(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Tighter passages for tension
+    adjusted["target_floor_percent"] = max(
+        0.22, layout.get("target_floor_percent", 0.27) - 0.05
+    )
+    adjusted["straight_bias"] = min(0.85, layout.get("straight_bias", 0.7) + 0.15)
+
+
+def _survival_cellular(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Structured caves with clear chambers for checkpoints
+    params = _nested_params(adjusted, layout, "cellular_params")
+    params["initial_wall_probability"] = min(
+        0.55, params.get("initial_wall_probability", 0.50) + 0.05
+    )
+    params["iterations"] = params.get("iterations", 4)
+
+
+# ===== KEY HUNT =====
+def _key_hunt_rooms(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Ensure enough separated areas for keys
+    adjusted["max_rooms"] = min(
+        25, layout.get("max_rooms", 15) + counts["key_count"] * 2
+    )
+    adjusted["room_size_min"] = layout.get("room_size_min", 4)
+    adjusted["room_size_max"] = max(14, layout.get("room_size_max", 12) + 2)
+
+
+def _key_hunt_drunkard(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # More branching for key locations
+    adjusted["num_drunkards"] = min(5, 2 + counts["key_count"])
+    adjusted["target_floor_percent"] = min(
+        0.30, layout.get("target_floor_percent", 0.27) + 0.03
+    )
+
+
+def _key_hunt_cellular(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Separated chambers for keys
+    params = _nested_params(adjusted, layout, "cellular_params")
+    params["initial_wall_probability"] = min(
+        0.54, params.get("initial_wall_probability", 0.50) + 0.04
+    )
+    params["iterations"] = params.get("iterations", 4)
+
+
+# ===== MULTI OBJECTIVE =====
+def _multi_rooms(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Balanced approach - enough variety for all objectives
+    adjusted["max_rooms"] = min(22, layout.get("max_rooms", 15) + 3)
+    adjusted["room_size_min"] = layout.get("room_size_min", 4)
+    adjusted["room_size_max"] = max(14, layout.get("room_size_max", 12) + 2)
+
+
+def _multi_drunkard(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    adjusted["target_floor_percent"] = min(
+        0.30, layout.get("target_floor_percent", 0.27) + 0.03
+    )
+
+
+def _multi_cellular(
+    adjusted: dict[str, Any], layout: dict[str, Any], counts: dict[str, Any]
+) -> None:
+    # Balanced structure
+    params = _nested_params(adjusted, layout, "cellular_params")
+    params["initial_wall_probability"] = min(
+        0.53, params.get("initial_wall_probability", 0.50) + 0.03
+    )
+    params["iterations"] = params.get("iterations", 4)
+
+
+_Adjuster = Callable[[dict[str, Any], dict[str, Any], dict[str, Any]], None]
+
+# (mission_type, algorithm group) -> adjuster, resolved with one dict lookup
+# instead of re-walking the mission-type/algorithm ladder per call
+_MISSION_ADJUSTERS: dict[tuple[str, str], _Adjuster] = {
+    ("linear_progression", "rooms"): _linear_rooms,
+    ("linear_progression", "drunkards_walk"): _linear_drunkard,
+    ("linear_progression", "cellular_automata"): _linear_cellular,
+    ("exploration", "rooms"): _exploration_rooms,
+    ("exploration", "drunkards_walk"): _exploration_drunkard,
+    ("exploration", "cellular_automata"): _exploration_cellular,
+    ("survival", "rooms"): _survival_rooms,
+    ("survival", "drunkards_walk"): _survival_drunkard,
+    ("survival", "cellular_automata"): _survival_cellular,
+    ("key_hunt", "rooms"): _key_hunt_rooms,
+    ("key_hunt", "drunkards_walk"): _key_hunt_drunkard,
+    ("key_hunt", "cellular_automata"): _key_hunt_cellular,
+    ("multi_objective", "rooms"): _multi_rooms,
+    ("multi_objective", "drunkards_walk"): _multi_drunkard,
+    ("multi_objective", "cellular_automata"): _multi_cellular,
+}
+
+
+class _FrozenDict(tuple):
+    """Marker tuple so _thaw can tell frozen dicts apart from plain tuples."""
+
+    __slots__ = ()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists to hashable lru_cache keys."""
+    if isinstance(value, dict):
+        return _FrozenDict(
+            (k, _freeze(v)) for k, v in sorted(value.items())
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze; rebuilds fresh dicts/lists the caller may mutate."""
+    if isinstance(value, _FrozenDict):
+        return {k: _thaw(v) for k, v in value}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
 
 
 def adjust_layout_for_mission(
@@ -18,220 +273,81 @@ def adjust_layout_for_mission(
     - Exploration missions → more branches and dead-ends
     - Boss fights → ensure large end room
     - Key hunts → ensure separated areas
+
+    The adjustment is pure, so repeated calls with the same layout, mission
+    and algorithm (common during parameter sweeps) hit an lru_cache keyed on
+    a frozen digest of the inputs. Each call thaws a fresh result dict, so
+    callers may mutate the return value freely.
     """
+    return _thaw(
+        _adjust_frozen(_freeze(layout), _freeze(mission), algorithm)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _adjust_frozen(
+    layout_frozen: _FrozenDict, mission_frozen: _FrozenDict, algorithm: str
+) -> _FrozenDict:
+    """Cached core; takes and returns frozen dicts so entries are immutable."""
+    return _freeze(
+        _adjust_layout(_thaw(layout_frozen), _thaw(mission_frozen), algorithm)
+    )
+
+
+def _adjust_layout(
+    layout: dict[str, Any], mission: dict[str, Any], algorithm: str
+) -> dict[str, Any]:
     mission_type = mission.get("mission_type", "exploration")
     objectives = mission.get("objectives", [])
 
     # Count objective types
-    needs_boss_room = any(obj["objective_type"] == "boss" for obj in objectives)
-    needs_dead_ends = any(obj["placement_rule"] == "dead_end" for obj in objectives)
-    dead_end_count = sum(
-        obj["count"] for obj in objectives if obj["placement_rule"] == "dead_end"
-    )
-    needs_large_rooms = any(
-        obj["placement_rule"] in ["central_room", "checkpoint"] for obj in objectives
-    )
+    counts: dict[str, Any] = {
+        "needs_boss_room": any(
+            obj["objective_type"] == "boss" for obj in objectives
+        ),
+        "needs_dead_ends": any(
+            obj["placement_rule"] == "dead_end" for obj in objectives
+        ),
+        "dead_end_count": sum(
+            obj["count"] for obj in objectives if obj["placement_rule"] == "dead_end"
+        ),
+        "needs_large_rooms": any(
+            obj["placement_rule"] in ("central_room", "checkpoint")
+            for obj in objectives
+        ),
+        "checkpoint_count": sum(
+            obj["count"]
+            for obj in objectives
+            if obj["placement_rule"] == "checkpoint"
+        ),
+        "key_count": sum(
+            obj["count"] for obj in objectives if obj["objective_type"] == "key"
+        ),
+    }
 
     # Create adjusted layout
     adjusted: dict[str, Any] = layout.copy()
 
-    # ===== LINEAR PROGRESSION =====
-    if mission_type == "linear_progression":
-        if algorithm in ["random_room_placement", "bsp", "hybrid_rooms_caves"]:
-            # Fewer, larger rooms with clear connections
-            adjusted["max_rooms"] = max(6, layout.get("max_rooms", 10) - 4)
-            adjusted["room_size_min"] = max(6, layout.get("room_size_min", 4) + 2)
-            adjusted["room_size_max"] = min(18, layout.get("room_size_max", 12) + 4)
-
-            if needs_boss_room:
-                # Ensure at least one LARGE room for boss
-                adjusted["room_size_max"] = min(20, adjusted["room_size_max"] + 3)
-
-        elif algorithm == "drunkards_walk":
-            # More winding for dramatic progression
-            adjusted["straight_bias"] = max(0.5, layout.get("straight_bias", 0.7) - 0.2)
-
-            # BOSS FIGHT SPECIAL CASE - need open area at end!
-            if needs_boss_room:
-                # Much more open for boss arena
-                adjusted["target_floor_percent"] = min(
-                    0.45, layout.get("target_floor_percent", 0.27) + 0.18
-                )
-                # Multiple drunkards converging creates larger areas
-                adjusted["num_drunkards"] = max(3, layout.get("num_drunkards", 1) + 2)
-                # Ensure we get drunkard_params dict
-                if "drunkard_params" not in adjusted:
-                    adjusted["drunkard_params"] = (
-                        layout.get("drunkard_params", {}).copy()
-                        if "drunkard_params" in layout
-                        else {}
-                    )
-                # Force smoothing to widen corridors into chambers
-                adjusted["drunkard_params"]["smooth"] = True
-                adjusted["drunkard_params"]["add_pillars"] = True
-                # Start from center so they spread outward
-                adjusted["drunkard_params"]["start_pos"] = "center"
-            else:
-                # Normal progression - keep it interesting
-                adjusted["target_floor_percent"] = min(
-                    0.30, layout.get("target_floor_percent", 0.27) + 0.03
-                )
-
-        elif algorithm == "cellular_automata":
-            # Boss needs larger connected spaces, but not one blob
-            if "cellular_params" not in adjusted:
-                adjusted["cellular_params"] = layout.get("cellular_params", {}).copy()
-            params = adjusted["cellular_params"]
-            params["initial_wall_probability"] = max(
-                0.48, params.get("initial_wall_probability", 0.50) - 0.02
-            )
-            params["iterations"] = params.get("iterations", 4)  # Keep standard
-
-    # ===== EXPLORATION =====
-    elif mission_type == "exploration":
-        if algorithm in ["random_room_placement", "bsp", "hybrid_rooms_caves"]:
-            # MORE rooms, MORE branches
-            adjusted["max_rooms"] = min(25, layout.get("max_rooms", 15) + 5)
-            adjusted["room_size_min"] = layout.get("room_size_min", 4)  # Keep varied
-            adjusted["room_size_max"] = layout.get("room_size_max", 12)  # Medium rooms
-
-            # If we need dead-ends, ensure more rooms
-            if needs_dead_ends:
-                adjusted["max_rooms"] = min(30, adjusted["max_rooms"] + dead_end_count)
-
-        elif algorithm == "drunkards_walk":
-            # Branching caves with corridors (not too open!)
-            adjusted["target_floor_percent"] = min(
-                0.30, layout.get("target_floor_percent", 0.27) + 0.03
-            )
-            adjusted["straight_bias"] = max(
-                0.60, layout.get("straight_bias", 0.7) - 0.10
-            )
-
-            # Multiple drunkards create branches for treasures
-            if "num_drunkards" not in adjusted or adjusted.get("num_drunkards", 1) < 3:
-                adjusted["num_drunkards"] = min(4, 2 + (dead_end_count // 2))
-
-        elif algorithm == "cellular_automata":
-            # Create NETWORK topology with varied corridors
-            if "cellular_params" not in adjusted:
-                adjusted["cellular_params"] = layout.get("cellular_params", {}).copy()
-            params = adjusted["cellular_params"]
-            # Higher walls (0.58) + more iterations = interesting corridors
-            params["initial_wall_probability"] = min(
-                0.58, params.get("initial_wall_probability", 0.50) + 0.08
-            )
-            params["iterations"] = min(6, params.get("iterations", 4) + 2)
-            # Adjust birth/death for more varied topology
-            params["birth_limit"] = 5  # Harder to create walls
-            params["death_limit"] = 2  # Easier to remove walls
-
-    # ===== SURVIVAL =====
-    elif mission_type == "survival":
-        if algorithm in ["random_room_placement", "bsp", "hybrid_rooms_caves"]:
-            # Medium number of safe rooms (checkpoints)
-            checkpoint_count = sum(
-                obj["count"]
-                for obj in objectives
-                if obj["placement_rule"] == "checkpoint"
-            )
-            adjusted["max_rooms"] = max(
-                8, min(20, layout.get("max_rooms", 12) + checkpoint_count)
-            )
-            adjusted["room_size_min"] = max(5, layout.get("room_size_min", 4) + 1)
-
-        elif algorithm == "drunkards_walk":
-            # Tighter passages for tension
-            adjusted["target_floor_percent"] = max(
-                0.22, layout.get("target_floor_percent", 0.27) - 0.05
-            )
-            adjusted["straight_bias"] = min(
-                0.85, layout.get("straight_bias", 0.7) + 0.15
-            )
-
-        elif algorithm == "cellular_automata":
-            # Structured caves with clear chambers for checkpoints
-            if "cellular_params" not in adjusted:
-                adjusted["cellular_params"] = layout.get("cellular_params", {}).copy()
-            params = adjusted["cellular_params"]
-            params["initial_wall_probability"] = min(
-                0.55, params.get("initial_wall_probability", 0.50) + 0.05
-            )
-            params["iterations"] = params.get("iterations", 4)
-
-    # ===== KEY HUNT =====
-    elif mission_type == "key_hunt":
-        key_count = sum(
-            obj["count"] for obj in objectives if obj["objective_type"] == "key"
-        )
-
-        if algorithm in ["random_room_placement", "bsp", "hybrid_rooms_caves"]:
-            # Ensure enough separated areas for keys
-            adjusted["max_rooms"] = min(25, layout.get("max_rooms", 15) + key_count * 2)
-            adjusted["room_size_min"] = layout.get("room_size_min", 4)
-            adjusted["room_size_max"] = max(14, layout.get("room_size_max", 12) + 2)
-
-        elif algorithm == "drunkards_walk":
-            # More branching for key locations
-            adjusted["num_drunkards"] = min(5, 2 + key_count)
-            adjusted["target_floor_percent"] = min(
-                0.30, layout.get("target_floor_percent", 0.27) + 0.03
-            )
-
-        elif algorithm == "cellular_automata":
-            # Separated chambers for keys
-            if "cellular_params" not in adjusted:
-                adjusted["cellular_params"] = layout.get("cellular_params", {}).copy()
-            params = adjusted["cellular_params"]
-            params["initial_wall_probability"] = min(
-                0.54, params.get("initial_wall_probability", 0.50) + 0.04
-            )
-            params["iterations"] = params.get("iterations", 4)
-
-    # ===== MULTI OBJECTIVE =====
-    elif mission_type == "multi_objective":
-        # Balanced approach - enough variety for all objectives
-        if algorithm in ["random_room_placement", "bsp", "hybrid_rooms_caves"]:
-            adjusted["max_rooms"] = min(22, layout.get("max_rooms", 15) + 3)
-            adjusted["room_size_min"] = layout.get("room_size_min", 4)
-            adjusted["room_size_max"] = max(14, layout.get("room_size_max", 12) + 2)
-
-        elif algorithm == "drunkards_walk":
-            adjusted["target_floor_percent"] = min(
-                0.30, layout.get("target_floor_percent", 0.27) + 0.03
-            )
-
-        elif algorithm == "cellular_automata":
-            # Balanced structure
-            if "cellular_params" not in adjusted:
-                adjusted["cellular_params"] = layout.get("cellular_params", {}).copy()
-            params = adjusted["cellular_params"]
-            params["initial_wall_probability"] = min(
-                0.53, params.get("initial_wall_probability", 0.50) + 0.03
-            )
-            params["iterations"] = params.get("iterations", 4)
+    is_room_algo = algorithm in _ROOM_ALGOS
+    algo_group = "rooms" if is_room_algo else algorithm
+    adjuster = _MISSION_ADJUSTERS.get((mission_type, algo_group))
+    if adjuster is not None:
+        adjuster(adjusted, layout, counts)
 
     # ===== ENSURE BOSS ROOM =====
-    if needs_boss_room:
-        if algorithm in ["random_room_placement", "bsp", "hybrid_rooms_caves"]:
-            # Guarantee at least one very large room
-            adjusted["room_size_max"] = max(adjusted.get("room_size_max", 12), 18)
+    if counts["needs_boss_room"] and is_room_algo:
+        # Guarantee at least one very large room
+        adjusted["room_size_max"] = max(adjusted.get("room_size_max", 12), 18)
 
     # ===== ENSURE DEAD ENDS =====
-    if needs_dead_ends and algorithm in [
-        "random_room_placement",
-        "bsp",
-        "hybrid_rooms_caves",
-    ]:
+    if counts["needs_dead_ends"] and is_room_algo:
         # More rooms = more potential dead ends
-        adjusted["max_rooms"] = max(adjusted.get("max_rooms", 15), 12 + dead_end_count)
+        adjusted["max_rooms"] = max(
+            adjusted.get("max_rooms", 15), 12 + counts["dead_end_count"]
+        )
 
     # ===== ENSURE LARGE ROOMS =====
-    if needs_large_rooms and algorithm in [
-        "random_room_placement",
-        "bsp",
-        "hybrid_rooms_caves",
-    ]:
+    if counts["needs_large_rooms"] and is_room_algo:
         adjusted["room_size_min"] = max(adjusted.get("room_size_min", 4), 6)
         adjusted["room_size_max"] = max(adjusted.get("room_size_max", 12), 14)
 
@@ -5,6 +5,8 @@ performing PCG of the map (i.e. generate_drunkards_walk(), generate_level(), etc
 import random
 from typing import Any, Self
 
+import numpy as np
+
 TILE_WALL = 0
 TILE_FLOOR = 1
 
@@ -17,6 +19,8 @@ class Rect:
     :param: w: width of the rectangle
     :param: h: height of the rectangle
     """
+    __slots__ = ("x1", "y1", "x2", "y2")
+
     def __init__(self, x: int, y: int, w: int, h: int) -> None:
         self.x1: int = x
         self.y1: int = y
@@ -58,7 +62,9 @@ class Rect:
 
 class BSPNode:
     """Binary Space Partitioning tree node."""
-    
+
+    __slots__ = ("rect", "left", "right", "room")
+
     def __init__(self, x: int, y: int, w: int, h: int):
         self.rect = Rect(x, y, w, h)
         self.left: BSPNode | None = None
@@ -81,114 +87,119 @@ class BSPNode:
         else:
             split_horizontally = random.choice([True, False])
         
-        # Determine split size
+        # Determine split size: biased toward the middle of the legal range
+        # (with +/- a third of jitter) so the tree stays balanced instead of
+        # producing slivers that can never split again
         if split_horizontally:
             max_split = height - min_size
             if max_split <= min_size:
                 return False
-            split_pos = random.randint(min_size, max_split)
+            mid = (min_size + max_split) // 2
+            split_pos = mid + random.randint(
+                -(mid - min_size) // 3, (max_split - mid) // 3
+            )
             self.left = BSPNode(self.rect.x1, self.rect.y1, width, split_pos)
             self.right = BSPNode(self.rect.x1, self.rect.y1 + split_pos, width, height - split_pos)
         else:
             max_split = width - min_size
             if max_split <= min_size:
                 return False
-            split_pos = random.randint(min_size, max_split)
+            mid = (min_size + max_split) // 2
+            split_pos = mid + random.randint(
+                -(mid - min_size) // 3, (max_split - mid) // 3
+            )
             self.left = BSPNode(self.rect.x1, self.rect.y1, split_pos, height)
             self.right = BSPNode(self.rect.x1 + split_pos, self.rect.y1, width - split_pos, height)
         
         return True
 
 
-def create_room(grid: list[list[int]], room: Rect) -> None:
+def create_room(grid: np.ndarray, room: Rect) -> None:
     """Creates a room based on a rectangle size.
 
     Args:
-        grid (list[list[int]]): map of the level
+        grid (np.ndarray): map of the level
         room (Rect): Rectangle representing room dimensions
     """
-    map_height: int = len(grid)
-    map_width: int = len(grid[0])
-    for y in range(max(1, room.y1), min(map_height - 1, room.y2)):  # Avoid carving edges
-        for x in range(max(1, room.x1), min(map_width - 1, room.x2)):
-            if 1 <= y < map_height - 1 and 1 <= x < map_width - 1:
-                grid[y][x] = TILE_FLOOR
+    map_height, map_width = grid.shape
+    # One slice assignment carves the whole room; clamps avoid the edges
+    grid[max(1, room.y1):min(map_height - 1, room.y2),
+         max(1, room.x1):min(map_width - 1, room.x2)] = TILE_FLOOR
 
 
-def create_h_tunnel(grid: list[list[int]], x1: int, x2: int, y: int, width: int = 1) -> None:
+def create_h_tunnel(grid: np.ndarray, x1: int, x2: int, y: int, width: int = 1) -> None:
     """Creates a horizontal tunnel
 
     Args:
-        grid (list[list[int]]): map of the level
+        grid (np.ndarray): map of the level
         x1 (int): _description_
         x2 (int): _description_
         y (int): Length of the tunnel/corridor
         width (int, optional): Width of the tunnel/corridor. Defaults to 1.
     """
     # get the size of the map
-    map_height: int = len(grid)
-    map_width: int = len(grid[0])
-    for x in range(min(x1, x2), max(x1, x2) + 1):
-        for i in range(width):
-            tunnel_y: int = y + i - (width // 2)
-            # Stay away from map edges slightly for tunnels
-            if 1 <= tunnel_y < map_height - 1 and 1 <= x < map_width - 1:
-                grid[tunnel_y][x] = TILE_FLOOR
-
-
-def create_v_tunnel(grid: list[list[int]], y1: int, y2: int, x: int, width: int = 1) -> None:
+    map_height, map_width = grid.shape
+    # Rows span y - width//2 up to width rows below that; one slice
+    # assignment carves the whole strip, clamped away from the map edges
+    y_lo = max(1, y - (width // 2))
+    y_hi = min(map_height - 1, y - (width // 2) + width)
+    x_lo = max(1, min(x1, x2))
+    x_hi = min(map_width - 1, max(x1, x2) + 1)
+    if y_lo < y_hi and x_lo < x_hi:
+        grid[y_lo:y_hi, x_lo:x_hi] = TILE_FLOOR
+
+
+def create_v_tunnel(grid: np.ndarray, y1: int, y2: int, x: int, width: int = 1) -> None:
     """Creates a vertical tunnel.
 
     Args:
-        grid (list[list[int]]): map of the level
+        grid (np.ndarray): map of the level
         x1 (int): _description_
         x2 (int): _description_
         y (int): Length of the tunnel/corridor
         width (int, optional): Width of the tunnel/corridor. Defaults to 1.
     """
     # ... (Keep implementation as before) ...
-    map_height: int = len(grid)
-    map_width: int = len(grid[0])
-    for y in range(min(y1, y2), max(y1, y2) + 1):
-        for i in range(width):
-            tunnel_x: int = x + i - (width // 2)
-            # Stay away from map edges slightly for tunnels
-            if 1 <= y < map_height - 1 and 1 <= tunnel_x < map_width - 1:
-                grid[y][tunnel_x] = TILE_FLOOR
+    map_height, map_width = grid.shape
+    x_lo = max(1, x - (width // 2))
+    x_hi = min(map_width - 1, x - (width // 2) + width)
+    y_lo = max(1, min(y1, y2))
+    y_hi = min(map_height - 1, max(y1, y2) + 1)
+    if y_lo < y_hi and x_lo < x_hi:
+        grid[y_lo:y_hi, x_lo:x_hi] = TILE_FLOOR
+
+
+def _wall_neighbor_counts(grid: np.ndarray) -> np.ndarray:
+    """8-neighbor wall counts for every interior cell.
+
+    Eight shifted slices summed at C speed replace the per-cell Python
+    3x3 probe loop; border cells participate as neighbors but are never
+    updated themselves, matching the original interior-only iteration.
+    """
+    walls = (grid == TILE_WALL).astype(np.uint8)
+    return (
+        walls[:-2, :-2] + walls[:-2, 1:-1] + walls[:-2, 2:]
+        + walls[1:-1, :-2] + walls[1:-1, 2:]
+        + walls[2:, :-2] + walls[2:, 1:-1] + walls[2:, 2:]
+    )
 
 
 # --- NEW: Drunkard's Walk Implementation ---
-def smooth_cave(grid: list[list[int]], iterations: int = 1) -> list[list[int]]:
+def smooth_cave(grid: np.ndarray, iterations: int = 1) -> np.ndarray:
     """Smooth cave walls using cellular automata rules."""
-    height = len(grid)
-    width = len(grid[0])
-    
     for _ in range(iterations):
-        new_grid = [row[:] for row in grid]  # Copy grid
-        
-        for y in range(1, height - 1):
-            for x in range(1, width - 1):
-                # Count wall neighbors
-                wall_count = 0
-                for dy in [-1, 0, 1]:
-                    for dx in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        if grid[y + dy][x + dx] == TILE_WALL:
-                            wall_count += 1
-                
-                # If mostly surrounded by walls, become wall; if mostly floor, become floor
-                if wall_count >= 5:
-                    new_grid[y][x] = TILE_WALL
-                elif wall_count <= 3:
-                    new_grid[y][x] = TILE_FLOOR
-        
+        wall_count = _wall_neighbor_counts(grid)
+        new_grid = grid.copy()
+        inner = new_grid[1:-1, 1:-1]
+        # If mostly surrounded by walls, become wall; if mostly floor, become floor
+        inner[wall_count >= 5] = TILE_WALL
+        inner[wall_count <= 3] = TILE_FLOOR
         grid = new_grid
-    
+
     return grid
 
 
-def generate_cellular_automata(config: dict[str, Any]) -> list[list[int]]:
+def generate_cellular_automata(config: dict[str, Any]) -> np.ndarray:
     """Generates natural cave systems using Cellular Automata."""
     layout_conf: dict[str, Any] = config['layout']
     ca_conf = layout_conf.get('cellular_params', {})
@@ -202,47 +213,27 @@ def generate_cellular_automata(config: dict[str, Any]) -> list[list[int]]:
     birth_limit = ca_conf.get('birth_limit', 4)  # Become floor if <= this many wall neighbors
     death_limit = ca_conf.get('death_limit', 3)  # Become wall if >= this many wall neighbors
     
-    # Initialize with random noise
-    grid: list[list[int]] = []
-    for y in range(height):
-        row = []
-        for x in range(width):
-            # Keep edges as walls
-            if x == 0 or y == 0 or x == width - 1 or y == height - 1:
-                row.append(TILE_WALL)
-            else:
-                # Random initialization
-                if random.random() < wall_probability:
-                    row.append(TILE_WALL)
-                else:
-                    row.append(TILE_FLOOR)
-        grid.append(row)
-    
-    # Apply cellular automata rules
-    for iteration in range(iterations):
-        new_grid = [row[:] for row in grid]
-        
-        for y in range(1, height - 1):
-            for x in range(1, width - 1):
-                # Count wall neighbors (8-direction)
-                wall_count = 0
-                for dy in [-1, 0, 1]:
-                    for dx in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        if grid[y + dy][x + dx] == TILE_WALL:
-                            wall_count += 1
-                
-                # Apply cellular automata rules (4-5 rule)
-                if grid[y][x] == TILE_FLOOR:
-                    # Floor cell - dies (becomes wall) if too many wall neighbors
-                    if wall_count >= 5:
-                        new_grid[y][x] = TILE_WALL
-                else:
-                    # Wall cell - becomes floor if few wall neighbors
-                    if wall_count <= 4:
-                        new_grid[y][x] = TILE_FLOOR
-        
+    # Initialize with random noise in one C-level fill, then force the
+    # borders back to walls
+    grid = np.where(
+        np.random.random((height, width)) < wall_probability,
+        TILE_WALL, TILE_FLOOR,
+    ).astype(np.uint8)
+    grid[0, :] = TILE_WALL
+    grid[-1, :] = TILE_WALL
+    grid[:, 0] = TILE_WALL
+    grid[:, -1] = TILE_WALL
+    
+    # Apply cellular automata rules (4-5 rule) on whole-grid masks
+    for _ in range(iterations):
+        wall_count = _wall_neighbor_counts(grid)
+        is_floor = grid[1:-1, 1:-1] == TILE_FLOOR
+        new_grid = grid.copy()
+        inner = new_grid[1:-1, 1:-1]
+        # Floor cell - dies (becomes wall) if too many wall neighbors
+        inner[is_floor & (wall_count >= 5)] = TILE_WALL
+        # Wall cell - becomes floor if few wall neighbors
+        inner[~is_floor & (wall_count <= 4)] = TILE_FLOOR
         grid = new_grid
     
     # Remove isolated areas to ensure connectivity
@@ -251,11 +242,10 @@ def generate_cellular_automata(config: dict[str, Any]) -> list[list[int]]:
     return grid
 
 
-def add_pillars_to_large_areas(grid: list[list[int]]) -> list[list[int]]:
+def add_pillars_to_large_areas(grid: np.ndarray) -> np.ndarray:
     """Add pillars to large open areas for more interesting topology."""
-    height = len(grid)
-    width = len(grid[0])
-    
+    height, width = grid.shape
+
     # Find large open areas (5x5 floor regions)
     for y in range(3, height - 3, 4):
         for x in range(3, width - 3, 4):
@@ -263,7 +253,7 @@ def add_pillars_to_large_areas(grid: list[list[int]]) -> list[list[int]]:
             floor_count = 0
             for dy in range(-2, 3):
                 for dx in range(-2, 3):
-                    if grid[y + dy][x + dx] == TILE_FLOOR:
+                    if grid[y + dy, x + dx] == TILE_FLOOR:
                         floor_count += 1
             
             # If very open, add a pillar with 40% chance
@@ -272,22 +262,27 @@ def add_pillars_to_large_areas(grid: list[list[int]]) -> list[list[int]]:
                 for dy in range(2):
                     for dx in range(2):
                         if 1 <= y + dy < height - 1 and 1 <= x + dx < width - 1:
-                            grid[y + dy][x + dx] = TILE_WALL
+                            grid[y + dy, x + dx] = TILE_WALL
     
     return grid
 
 
-def generate_drunkards_walk(config: dict[str, Any]) -> list[list[int]]:
+def generate_drunkards_walk(config: dict[str, Any]) -> np.ndarray:
     """Generates interesting cave structures using multiple drunkards."""
     layout_conf: dict[str, Any] = config['layout']
     drunkard_conf = layout_conf['drunkard_params']
 
     width: int = layout_conf['map_width']
     height: int = layout_conf['map_height']
-    grid: list[list[int]] = [
-        [TILE_WALL for _ in range(width)] for _ in range(height)]
-
+    # The serial walk runs over a flat bytearray indexed y*width+x — one
+    # byte load/store per step instead of an ndarray scalar access (the
+    # same idiom as the mission-processor flood fill); it becomes an
+    # ndarray once, after the walks finish
     total_tiles: int = width * height
+    cells = bytearray(total_tiles)
+    # Every carved cell is recorded here, so later drunkards pick their
+    # restart tile without an O(H*W) rescan of the buffer
+    floor_cells: list[int] = []
     target_floor_tiles = int(total_tiles * drunkard_conf['target_floor_percent'])
 
     # Determine start position
@@ -304,7 +299,15 @@ def generate_drunkards_walk(config: dict[str, Any]) -> list[list[int]]:
 
     directions: list[tuple[int, int]] = [(0, -1), (1, 0), (0, 1), (-1, 0)]
     straight_bias: float = drunkard_conf['straight_bias']
-    
+
+    # Hot-loop RNG: a bound getrandbits skips the module-global lookup per
+    # call, two bits draw a direction without randint's range arithmetic,
+    # and the straight-bias test compares 16-bit ints so no PyFloat is
+    # built per step. Still the global Mersenne stream, so random.seed()
+    # keeps runs reproducible.
+    getrandbits = random.getrandbits
+    straight_threshold = int(straight_bias * 65536.0)
+
     # Adjust number of drunkards based on target floor percentage
     # Low floor % (< 0.30) = tight maze with fewer drunkards
     # High floor % (>= 0.30) = open caves with more drunkards
@@ -322,29 +325,31 @@ def generate_drunkards_walk(config: dict[str, Any]) -> list[list[int]]:
             current_x, current_y = start_x, start_y
         else:
             # Start from an existing floor tile
-            floor_tiles = [(x, y) for y in range(height) for x in range(width) if grid[y][x] == TILE_FLOOR]
-            if floor_tiles:
-                current_x, current_y = random.choice(floor_tiles)
+            if floor_cells:
+                idx = random.choice(floor_cells)
+                current_x, current_y = idx % width, idx // width
             else:
                 current_x, current_y = start_x, start_y
         
-        last_direction: int = random.randint(0, 3)
+        last_direction: int = getrandbits(2)
         drunkard_tiles = 0
         
         while drunkard_tiles < tiles_per_drunkard:
             # Carve with single tiles (no 2x2, keeps passages narrow)
-            if grid[current_y][current_x] == TILE_WALL:
-                grid[current_y][current_x] = TILE_FLOOR
+            pos = current_y * width + current_x
+            if not cells[pos]:
+                cells[pos] = TILE_FLOOR
+                floor_cells.append(pos)
                 drunkard_tiles += 1
             
             if drunkard_tiles >= tiles_per_drunkard:
                 break
             
             # Direction selection
-            if random.random() < straight_bias:
+            if getrandbits(16) < straight_threshold:
                 chosen_direction = last_direction
             else:
-                chosen_direction = random.randint(0, 3)
+                chosen_direction = getrandbits(2)
             
             # Move
             dx, dy = directions[chosen_direction]
@@ -357,7 +362,9 @@ def generate_drunkards_walk(config: dict[str, Any]) -> list[list[int]]:
                 last_direction = chosen_direction
             else:
                 # Hit wall, turn randomly
-                last_direction = random.randint(0, 3)
+                last_direction = getrandbits(2)
+
+    grid = np.frombuffer(cells, dtype=np.uint8).reshape(height, width)
 
     # Only smooth and add pillars for higher floor percentages
     # Tight mazes (< 30% floor) stay raw for that maze feel
@@ -373,13 +380,13 @@ def generate_drunkards_walk(config: dict[str, Any]) -> list[list[int]]:
     return grid
 
 
-def generate_bsp(config: dict[str, Any]) -> list[list[int]]:
+def generate_bsp(config: dict[str, Any]) -> np.ndarray:
     """Generates a dungeon using Binary Space Partitioning."""
     layout_conf: dict[str, Any] = config['layout']
     width: int = layout_conf['map_width']
     height: int = layout_conf['map_height']
     
-    grid: list[list[int]] = [[TILE_WALL for _ in range(width)] for _ in range(height)]
+    grid = np.zeros((height, width), dtype=np.uint8)
     
     # Create root node spanning entire map
     root = BSPNode(1, 1, width - 2, height - 2)
@@ -420,21 +427,30 @@ def generate_bsp(config: dict[str, Any]) -> list[list[int]]:
     
     # Connect sibling rooms
     def connect_siblings(node: BSPNode) -> None:
-        """Recursively connect sibling nodes."""
-        if node.left and node.right:
-            connect_siblings(node.left)
-            connect_siblings(node.right)
-            
+        """Connect sibling rooms, children before parents (post-order)."""
+        # Iterative post-order: reversing a root/right/left pre-order walk
+        # yields the same left/right/parent order the recursion used,
+        # without per-call frame overhead
+        order: list[BSPNode] = []
+        stack: list[BSPNode] = [node]
+        while stack:
+            current = stack.pop()
+            if current.left and current.right:
+                order.append(current)
+                stack.append(current.left)
+                stack.append(current.right)
+
+        for current in reversed(order):
             # Get rooms from left and right subtrees
-            left_room = get_room_from_subtree(node.left)
-            right_room = get_room_from_subtree(node.right)
-            
+            left_room = get_room_from_subtree(current.left)
+            right_room = get_room_from_subtree(current.right)
+
             if left_room and right_room:
                 lx, ly = left_room.center()
                 rx, ry = right_room.center()
-                
+
                 corridor_width = layout_conf.get('corridor_width', 1)
-                
+
                 # Create L-shaped corridor
                 if random.choice([True, False]):
                     create_h_tunnel(grid, lx, rx, ly, corridor_width)
@@ -442,17 +458,19 @@ def generate_bsp(config: dict[str, Any]) -> list[list[int]]:
                 else:
                     create_v_tunnel(grid, ly, ry, lx, corridor_width)
                     create_h_tunnel(grid, lx, rx, ry, corridor_width)
-    
+
     def get_room_from_subtree(node: BSPNode) -> Rect | None:
         """Get a room from this node or its children."""
-        if node.room:
-            return node.room
-        if node.left:
-            room = get_room_from_subtree(node.left)
-            if room:
-                return room
-        if node.right:
-            return get_room_from_subtree(node.right)
+        # Left-preferring iterative descent (left pops before right)
+        stack: list[BSPNode] = [node]
+        while stack:
+            current = stack.pop()
+            if current.room:
+                return current.room
+            if current.right:
+                stack.append(current.right)
+            if current.left:
+                stack.append(current.left)
         return None
     
     connect_siblings(root)
@@ -461,7 +479,7 @@ def generate_bsp(config: dict[str, Any]) -> list[list[int]]:
 
 
 # --- MODIFIED: Main Dispatcher Function ---
-def generate_hybrid_rooms_caves(config: dict[str, Any]) -> list[list[int]]:
+def generate_hybrid_rooms_caves(config: dict[str, Any]) -> np.ndarray:
     """
     Hybrid: Structured rooms connected by organic winding passages.
     Combines BSP room placement with drunkard's walk corridors.
@@ -470,7 +488,7 @@ def generate_hybrid_rooms_caves(config: dict[str, Any]) -> list[list[int]]:
     width: int = layout_conf['map_width']
     height: int = layout_conf['map_height']
     
-    grid: list[list[int]] = [[TILE_WALL for _ in range(width)] for _ in range(height)]
+    grid = np.zeros((height, width), dtype=np.uint8)
     
     # 1. Generate rooms using BSP (but smaller to leave space for organic corridors)
     root = BSPNode(1, 1, width - 2, height - 2)
@@ -517,7 +535,7 @@ def generate_hybrid_rooms_caves(config: dict[str, Any]) -> list[list[int]]:
         steps = 0
         
         while not target_reached and steps < max_steps:
-            grid[current_y][current_x] = TILE_FLOOR
+            grid[current_y, current_x] = TILE_FLOOR
             
             # Check if reached target
             if abs(current_x - end_x) <= 2 and abs(current_y - end_y) <= 2:
@@ -554,7 +572,7 @@ def generate_hybrid_rooms_caves(config: dict[str, Any]) -> list[list[int]]:
     return grid
 
 
-def generate_cellular_rooms(config: dict[str, Any]) -> list[list[int]]:
+def generate_cellular_rooms(config: dict[str, Any]) -> np.ndarray:
     """
     Hybrid: Cellular automata with hand-placed room seeds.
     Creates natural-looking caves with distinct chamber areas.
@@ -563,16 +581,15 @@ def generate_cellular_rooms(config: dict[str, Any]) -> list[list[int]]:
     width: int = layout_conf['map_width']
     height: int = layout_conf['map_height']
     
-    # Initialize with noise
-    grid: list[list[int]] = []
-    for y in range(height):
-        row = []
-        for x in range(width):
-            if x == 0 or y == 0 or x == width - 1 or y == height - 1:
-                row.append(TILE_WALL)
-            else:
-                row.append(TILE_WALL if random.random() < 0.58 else TILE_FLOOR)
-        grid.append(row)
+    # Initialize with noise in one C-level fill, then force the borders
+    # back to walls
+    grid = np.where(
+        np.random.random((height, width)) < 0.58, TILE_WALL, TILE_FLOOR
+    ).astype(np.uint8)
+    grid[0, :] = TILE_WALL
+    grid[-1, :] = TILE_WALL
+    grid[:, 0] = TILE_WALL
+    grid[:, -1] = TILE_WALL
     
     # Seed some guaranteed open areas (rooms)
     num_seeds = random.randint(4, 7)
@@ -586,25 +603,16 @@ def generate_cellular_rooms(config: dict[str, Any]) -> list[list[int]]:
             for dx in range(seed_size):
                 sx, sy = seed_x + dx, seed_y + dy
                 if 1 <= sx < width - 1 and 1 <= sy < height - 1:
-                    grid[sy][sx] = TILE_FLOOR
+                    grid[sy, sx] = TILE_FLOOR
     
-    # Apply cellular automata
+    # Apply cellular automata (same vectorized 4-5 rule as above)
     for _ in range(5):
-        new_grid = [row[:] for row in grid]
-        for y in range(1, height - 1):
-            for x in range(1, width - 1):
-                wall_count = sum([
-                    grid[y+dy][x+dx] == TILE_WALL
-                    for dy in [-1, 0, 1] for dx in [-1, 0, 1]
-                    if not (dx == 0 and dy == 0)
-                ])
-                
-                if grid[y][x] == TILE_FLOOR:
-                    if wall_count >= 5:
-                        new_grid[y][x] = TILE_WALL
-                else:
-                    if wall_count <= 4:
-                        new_grid[y][x] = TILE_FLOOR
+        wall_count = _wall_neighbor_counts(grid)
+        is_floor = grid[1:-1, 1:-1] == TILE_FLOOR
+        new_grid = grid.copy()
+        inner = new_grid[1:-1, 1:-1]
+        inner[is_floor & (wall_count >= 5)] = TILE_WALL
+        inner[~is_floor & (wall_count <= 4)] = TILE_FLOOR
         grid = new_grid
     
     grid = remove_isolated_areas(grid)
@@ -619,21 +627,25 @@ def generate_level(config: dict[Any, Any]) -> list[list[int]]:
     algorithm: str = config.get('algorithm', 'random_room_placement')
 
     if algorithm == 'random_room_placement':
-        return generate_random_rooms(config)
+        grid = generate_random_rooms(config)
     elif algorithm == 'drunkards_walk':
-        return generate_drunkards_walk(config)
+        grid = generate_drunkards_walk(config)
     elif algorithm == 'bsp':
-        return generate_bsp(config)
+        grid = generate_bsp(config)
     elif algorithm == 'cellular_automata':
-        return generate_cellular_automata(config)
+        grid = generate_cellular_automata(config)
     elif algorithm == 'hybrid_rooms_caves':
-        return generate_hybrid_rooms_caves(config)
+        grid = generate_hybrid_rooms_caves(config)
     elif algorithm == 'cellular_rooms':
-        return generate_cellular_rooms(config)
+        grid = generate_cellular_rooms(config)
     else:
         print(
             f"Warning: Unknown algorithm '{algorithm}'. Using default random_room_placement.")
-        return generate_random_rooms(config)
+        grid = generate_random_rooms(config)
+
+    # The generators work on uint8 ndarrays internally; hand callers the
+    # plain list-of-lists the rest of the codebase expects
+    return grid.tolist()
 
 
 # --- RENAMED: Original Room Placement Function ---
@@ -659,67 +671,87 @@ def find_nearest_unconnected_room(room: Rect, rooms: list[Rect], connected: set[
     return nearest_idx
 
 
-def remove_isolated_areas(grid: list[list[int]]) -> list[list[int]]:
+def remove_isolated_areas(grid: np.ndarray) -> np.ndarray:
     """Remove small isolated floor regions using flood fill."""
-    height = len(grid)
-    width = len(grid[0])
-    visited = [[False for _ in range(width)] for _ in range(height)]
-    
-    def flood_fill(start_x: int, start_y: int) -> int:
-        """Flood fill and return area size."""
-        stack = [(start_x, start_y)]
-        area_tiles = []
-        
+    height, width = grid.shape
+    size = height * width
+    # Flood fill over a flat bytes buffer with a bytearray visited map:
+    # single byte loads per probe instead of nested-list and tuple traffic
+    flat = grid.tobytes()
+    visited = bytearray(size)
+
+    def flood_fill(start: int) -> list[int]:
+        """Flood fill from start and return the region's flat indices."""
+        visited[start] = 1
+        tiles: list[int] = [start]
+        stack: list[int] = [start]
+
         while stack:
-            x, y = stack.pop()
-            if visited[y][x] or grid[y][x] == TILE_WALL:
-                continue
-            
-            visited[y][x] = True
-            area_tiles.append((x, y))
-            
-            # Check 4 directions
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < width and 0 <= ny < height and not visited[ny][nx]:
-                    stack.append((nx, ny))
-        
-        return len(area_tiles), area_tiles
-    
-    # Find all connected regions
-    regions = []
-    for y in range(height):
-        for x in range(width):
-            if grid[y][x] == TILE_FLOOR and not visited[y][x]:
-                size, tiles = flood_fill(x, y)
-                regions.append((size, tiles))
-    
-    # Keep only the largest region, fill others with walls
-    if regions:
-        regions.sort(reverse=True, key=lambda r: r[0])
-        largest_region = set(regions[0][1])
-        
-        for y in range(height):
-            for x in range(width):
-                if grid[y][x] == TILE_FLOOR and (x, y) not in largest_region:
-                    grid[y][x] = TILE_WALL
-    
-    return grid
+            idx = stack.pop()
+            x = idx % width
+            if x + 1 < width:
+                n = idx + 1
+                if not visited[n] and flat[n] != TILE_WALL:
+                    visited[n] = 1
+                    tiles.append(n)
+                    stack.append(n)
+            if x > 0:
+                n = idx - 1
+                if not visited[n] and flat[n] != TILE_WALL:
+                    visited[n] = 1
+                    tiles.append(n)
+                    stack.append(n)
+            n = idx + width
+            if n < size and not visited[n] and flat[n] != TILE_WALL:
+                visited[n] = 1
+                tiles.append(n)
+                stack.append(n)
+            n = idx - width
+            if n >= 0 and not visited[n] and flat[n] != TILE_WALL:
+                visited[n] = 1
+                tiles.append(n)
+                stack.append(n)
+
+        return tiles
+
+    # Track only the largest region (first-found wins ties, like the old
+    # stable sort); everything else becomes wall
+    largest: list[int] = []
+    for idx in range(size):
+        if flat[idx] == TILE_FLOOR and not visited[idx]:
+            tiles = flood_fill(idx)
+            if len(tiles) > len(largest):
+                largest = tiles
+
+    if not largest:
+        return grid
 
+    # Rebuild in one shot: walls everywhere, floor at the kept indices
+    cleaned = np.zeros(size, dtype=np.uint8)
+    cleaned[np.asarray(largest, dtype=np.int64)] = TILE_FLOOR
+    return cleaned.reshape(height, width)
 
-def generate_random_rooms(config: dict[Any, Any]) -> list[list[int]]:
+
+def generate_random_rooms(config: dict[Any, Any]) -> np.ndarray:
     """Generates a dungeon level grid using random room placement with improved connectivity."""
     layout_conf: dict[str, Any] = config['layout']
     width: int = layout_conf['map_width']
     height: int = layout_conf['map_height']
-    grid: list[list[int]] = [
-        [TILE_WALL for _ in range(width)] for _ in range(height)]
+    grid = np.zeros((height, width), dtype=np.uint8)
     rooms: list[Rect] = []
     num_rooms = 0
     max_rooms: int = layout_conf['max_rooms']
     room_min_size: int = layout_conf['room_size_min']
     room_max_size: int = layout_conf['room_size_max']
 
+    # Accepted-room corners as SoA arrays: each candidate is tested against
+    # every accepted room with one broadcast instead of a Python method call
+    # per pair
+    rx1 = np.empty(max_rooms, dtype=np.int32)
+    ry1 = np.empty(max_rooms, dtype=np.int32)
+    rx2 = np.empty(max_rooms, dtype=np.int32)
+    ry2 = np.empty(max_rooms, dtype=np.int32)
+
     # Generate rooms with better attempts
     for _ in range(max_rooms * 3):
         if num_rooms >= max_rooms:
@@ -730,16 +762,21 @@ def generate_random_rooms(config: dict[Any, Any]) -> list[list[int]]:
         y: int = random.randint(1, height - h - 2)
         new_room = Rect(x, y, w, h)
         
-        # Check if overlaps with existing rooms
-        failed = False
-        for other_room in rooms:
-            if new_room.intersects(other_room):
-                failed = True
-                break
-        
+        # Check if overlaps with existing rooms (same one-tile margin as
+        # Rect.intersects), vectorized over all accepted rooms
+        n = num_rooms
+        failed = bool(np.any(
+            (rx1[:n] <= new_room.x2 + 1) & (rx2[:n] >= new_room.x1 - 1)
+            & (ry1[:n] <= new_room.y2 + 1) & (ry2[:n] >= new_room.y1 - 1)
+        ))
+
         if not failed:
             create_room(grid, new_room)
             rooms.append(new_room)
+            rx1[n] = new_room.x1
+            ry1[n] = new_room.y1
+            rx2[n] = new_room.x2
+            ry2[n] = new_room.y2
             num_rooms += 1
 
     if not rooms:
@@ -747,19 +784,19 @@ def generate_random_rooms(config: dict[Any, Any]) -> list[list[int]]:
 
     # Improved connectivity: connect each room to nearest unconnected room
     corridor_width: int = layout_conf['corridor_width']
-    connected: set[int] = {0}  # First room is connected
-    
+
+    # All pairwise squared center distances in one broadcast; argmin on the
+    # squared values picks the same room as per-pair sqrt'd distance() calls
+    centers = np.array([room.center() for room in rooms], dtype=np.int64)
+    dx = centers[:, 0:1] - centers[:, 0]
+    dy = centers[:, 1:2] - centers[:, 1]
+    d2 = dx * dx + dy * dy
+
     for i in range(1, len(rooms)):
-        # Find nearest connected room
-        nearest_dist = float('inf')
-        nearest_idx = 0
-        
-        for j in connected:
-            dist = distance(rooms[i], rooms[j])
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_idx = j
-        
+        # Rooms 0..i-1 are connected by the time room i is processed, so
+        # the nearest connected room is an argmin over the first i entries
+        nearest_idx = int(d2[i, :i].argmin())
+
         # Connect to nearest connected room
         (prev_x, prev_y) = rooms[nearest_idx].center()
         (new_x, new_y) = rooms[i].center()
@@ -770,8 +807,6 @@ def generate_random_rooms(config: dict[Any, Any]) -> list[list[int]]:
         else:
             create_v_tunnel(grid, prev_y, new_y, prev_x, corridor_width)
             create_h_tunnel(grid, prev_x, new_x, new_y, corridor_width)
-        
-        connected.add(i)
     
     # Add some extra connections for loops (more interesting gameplay)
     extra_connections = min(3, len(rooms) // 4)
@@ -1,6 +1,7 @@
 """Player entity for the roguelike game."""
 
 from pathlib import Path
+import numpy as np
 import pygame
 
 
@@ -25,17 +26,19 @@ class Player:
         # Load and scale the player sprite
         assets_path = Path(__file__).parent.parent / "assets"
         sprite_path = assets_path / "guy.png"
-        self.sprite = pygame.image.load(str(sprite_path))
+        # convert_alpha() matches the display format so blits skip per-frame
+        # pixel conversion
+        self.sprite = pygame.image.load(str(sprite_path)).convert_alpha()
         self.sprite = pygame.transform.scale(self.sprite, (tile_size, tile_size))
 
-    def move(self, dx: int, dy: int, level_grid: list[list[int]]) -> bool:
+    def move(self, dx: int, dy: int, level_grid: np.ndarray) -> bool:
         """
         Attempt to move the player by the given delta.
 
         Args:
             dx: Change in x-coordinate (-1, 0, or 1)
             dy: Change in y-coordinate (-1, 0, or 1)
-            level_grid: 2D grid of the level (grid[y][x])
+            level_grid: 2D int8 grid of the level (grid[y, x])
 
         Returns:
             True if the move was successful, False if blocked
@@ -43,14 +46,15 @@ class Player:
         new_x = self.x + dx
         new_y = self.y + dy
 
-        # Check bounds
-        if new_y < 0 or new_y >= len(level_grid):
+        # Check bounds against the array shape (no row object materialized)
+        map_height, map_width = level_grid.shape
+        if new_y < 0 or new_y >= map_height:
             return False
-        if new_x < 0 or new_x >= len(level_grid[0]):
+        if new_x < 0 or new_x >= map_width:
             return False
 
-        # Check for wall collision
-        if level_grid[new_y][new_x] != self.TILE_FLOOR:
+        # Check for wall collision; tuple indexing hits the element directly
+        if level_grid[new_y, new_x] != self.TILE_FLOOR:
             return False
 
         # Move is valid
@@ -1,10 +1,12 @@
 """
 Contains Renderer object which renders the game and the map. Contains int
-values for each tile for the map. Map is represented as a list[list[int]].
+values for each tile for the map. Map is represented as a 2D int8 ndarray.
 
 """
+import threading
 from pathlib import Path
 from typing import Literal
+import numpy as np
 import pygame
 from pygame.font import Font
 from src.camera import Camera
@@ -39,19 +41,32 @@ class Renderer:
         self.screen_width: int = screen_width
         self.screen_height: int = screen_height
         self.screen_margin_width  = 20
+        # vsync=1 lets flip block on the GPU swap for jitter-free pacing
+        # (best effort; SDL falls back silently where unsupported)
         self.screen: pygame.Surface = pygame.display.set_mode(
-            (screen_width, screen_height)
+            (screen_width, screen_height), flags=pygame.SCALED, vsync=1
         )
         # Basic font for any text later
         self.font: Font = pygame.font.SysFont(None, 24)
         self._cwd: Path = Path.cwd()
         self._assets_path = Path.cwd() / "assets"
 
-        pygame.display.set_icon(pygame.image.load(self._assets_path / "icon.png"))
-        self._bkgd_im = pygame.image.load(self._assets_path / "startmenu.png")
+        # Decode the window icon in the background instead of blocking init
+        # on file I/O; _ensure_icon installs it once the load finishes.
+        self._icon_surface: pygame.Surface | None = None
+        self._icon_set = False
+        threading.Thread(target=self._load_icon, daemon=True).start()
+
+        # convert()/convert_alpha() once at load so every blit skips the
+        # per-frame pixel-format conversion
+        self._bkgd_im = pygame.image.load(
+            self._assets_path / "startmenu.png"
+        ).convert()
 
         # Load and cache player sprite
-        self._player_sprite = pygame.image.load(self._assets_path / "guy.png")
+        self._player_sprite = pygame.image.load(
+            self._assets_path / "guy.png"
+        ).convert_alpha()
         self._player_sprite = pygame.transform.scale(
             self._player_sprite, (TILE_SIZE, TILE_SIZE)
         )
@@ -59,15 +74,82 @@ class Renderer:
         # Initialize camera
         self.camera: Camera = Camera(screen_width, screen_height, TILE_SIZE)
 
+        # First draw_level call must report the whole screen dirty (it may be
+        # covering menu pixels); later calls only report the viewport area.
+        self._level_drawn_once = False
+
+        # Whole level pre-rendered to one offscreen surface (set by
+        # bake_level_surface); draw_level then does a single clipped blit.
+        self._level_surface: pygame.Surface | None = None
+
+    def preload_tiles(self) -> None:
+        """Re-convert every cached surface to the display's pixel format.
+
+        Blitting an unconverted surface re-pays a pixel-format conversion on
+        every frame; converting once here keeps draw calls pure raster copies.
+        Must be called after pygame.display.set_mode.
+        """
+        if pygame.display.get_surface() is None:
+            raise pygame.error("preload_tiles called before display.set_mode")
+        self._bkgd_im = self._bkgd_im.convert(self.screen)
+        self._player_sprite = self._player_sprite.convert_alpha(self.screen)
+
+    def _load_icon(self) -> None:
+        """Background load of the window icon surface."""
+        self._icon_surface = pygame.image.load(self._assets_path / "icon.png")
+
+    def _ensure_icon(self) -> None:
+        """Install the window icon once its background load has completed."""
+        if not self._icon_set and self._icon_surface is not None:
+            pygame.display.set_icon(self._icon_surface)
+            self._icon_set = True
+
+    def bake_level_surface(self, grid: np.ndarray) -> pygame.Surface:
+        """Pre-render the whole level grid to one offscreen surface.
+
+        The tile grid only changes on level (re)generation, so paying the full
+        tile traversal once here lets draw_level replace per-frame tile blits
+        with a single clipped memcpy of this surface.
+
+        Args:
+            grid: 2D int8 array representing the level layout
+
+        Returns:
+            The baked level surface (also cached on the renderer)
+        """
+        map_height: int = len(grid)
+        map_width: int = len(grid[0])
+        surface = pygame.Surface(
+            (map_width * TILE_SIZE, map_height * TILE_SIZE)
+        )
+        surface.fill(COLOR_BLACK)
+        for y in range(map_height):
+            row = grid[y]
+            screen_y = y * TILE_SIZE
+            for x in range(map_width):
+                tile: int = row[x]
+                rect = pygame.Rect(x * TILE_SIZE, screen_y, TILE_SIZE, TILE_SIZE)
+                if tile == TILE_WALL:
+                    pygame.draw.rect(surface, COLOR_DARK_GREY, rect)
+                elif tile == TILE_FLOOR:
+                    pygame.draw.rect(surface, COLOR_LIGHT_GREY, rect)
+        self._level_surface = surface.convert(self.screen)
+        return self._level_surface
+
     def draw_level(
-        self, grid: list[list[int]], player_pos: tuple[int, int] | None = None
-    ) -> None:
+        self, grid: np.ndarray, player_pos: tuple[int, int] | None = None
+    ) -> list[pygame.Rect]:
         """Draws the visible portion of the level grid and player onto the screen.
 
         Args:
-            grid: 2D list representing the level layout
+            grid: 2D int8 array representing the level layout
             player_pos: Optional tuple of (x, y) grid coordinates for player position
+
+        Returns:
+            List of dirty rects covering everything drawn this call, suitable
+            for pygame.display.update()
         """
+        self._ensure_icon()
         self.screen.fill(COLOR_BLACK)  # Clear screen
 
         map_height: int = len(grid)
@@ -79,20 +161,39 @@ class Renderer:
         # Get visible tile range from camera
         min_x, max_x, min_y, max_y = self.camera.get_visible_tile_range()
 
-        # Draw only visible level tiles
-        for y in range(min_y, max_y):
-            for x in range(min_x, max_x):
-                tile: int = grid[y][x]
+        # Specialize the world-to-screen conversion for this frame: the camera
+        # offset is constant across tiles, so compute it once and convert each
+        # tile with two subtractions instead of a method call.
+        offset_x, offset_y = self.camera.get_offset()
 
-                # Convert world coordinates to screen coordinates
-                screen_x, screen_y = self.camera.world_to_screen(x, y)
-                rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
+        if self._level_surface is not None:
+            # One clipped blit of the baked level instead of a tile loop. The
+            # offset can be negative when the map is smaller than the window,
+            # so split it into a destination shift and a source rect.
+            dest = (max(0, -offset_x), max(0, -offset_y))
+            src = pygame.Rect(
+                max(0, offset_x),
+                max(0, offset_y),
+                self.screen_width,
+                self.screen_height,
+            )
+            self.screen.blit(self._level_surface, dest, src)
+        else:
+            # Fallback: draw only visible level tiles
+            for y in range(min_y, max_y):
+                row = grid[y]
+                screen_y = y * TILE_SIZE - offset_y
+                for x in range(min_x, max_x):
+                    tile: int = row[x]
+                    rect = pygame.Rect(
+                        x * TILE_SIZE - offset_x, screen_y, TILE_SIZE, TILE_SIZE
+                    )
 
-                if tile == TILE_WALL:
-                    pygame.draw.rect(self.screen, COLOR_DARK_GREY, rect)
-                elif tile == TILE_FLOOR:
-                    pygame.draw.rect(self.screen, COLOR_LIGHT_GREY, rect)
-                # Add more tile types (enemies, treasure) later with different colors/sprites
+                    if tile == TILE_WALL:
+                        pygame.draw.rect(self.screen, COLOR_DARK_GREY, rect)
+                    elif tile == TILE_FLOOR:
+                        pygame.draw.rect(self.screen, COLOR_LIGHT_GREY, rect)
+                    # Add more tile types (enemies, treasure) later with different colors/sprites
 
         # Draw player sprite on top of the level
         if player_pos is not None:
@@ -101,10 +202,53 @@ class Renderer:
             screen_x, screen_y = self.camera.world_to_screen(player_x, player_y)
             self.screen.blit(self._player_sprite, (screen_x, screen_y))
 
+        # Report what changed so the caller can update just those rects
+        if not self._level_drawn_once:
+            self._level_drawn_once = True
+            return [self.screen.get_rect()]
+        left, top = self.camera.world_to_screen(min_x, min_y)
+        right, bottom = self.camera.world_to_screen(max_x, max_y)
+        return [pygame.Rect(left, top, right - left, bottom - top)]
+
+    def draw_level_incremental(
+        self,
+        grid: np.ndarray,
+        old_pos: tuple[int, int],
+        player_pos: tuple[int, int],
+    ) -> list[pygame.Rect]:
+        """Repaint only the tiles the player vacated and entered.
+
+        Only valid while the camera is stationary; the caller falls back to
+        draw_level whenever the camera or the grid changed.
+
+        Args:
+            grid: 2D int8 array representing the level layout
+            old_pos: (x, y) grid coordinates the player moved from
+            player_pos: (x, y) grid coordinates the player moved to
+
+        Returns:
+            Dirty rects for the two repainted tiles, suitable for
+            pygame.display.update()
+        """
+        rects: list[pygame.Rect] = []
+        for tile_x, tile_y in (old_pos, player_pos):
+            screen_x, screen_y = self.camera.world_to_screen(tile_x, tile_y)
+            rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
+            if grid[tile_y][tile_x] == TILE_WALL:
+                pygame.draw.rect(self.screen, COLOR_DARK_GREY, rect)
+            else:
+                pygame.draw.rect(self.screen, COLOR_LIGHT_GREY, rect)
+            rects.append(rect)
+
+        # Player sprite goes on top of the entered tile
+        self.screen.blit(self._player_sprite, rects[1].topleft)
+        return rects
+
     def draw_start_menu(self):
         """
         Draw Start Menu for Game.
         """
+        self._ensure_icon()
         self.screen.fill((0, 0, 0))
         self.screen.blit(self._bkgd_im, (20,0))
         font = pygame.font.SysFont("arial", 40)
@@ -131,6 +275,7 @@ class Renderer:
         TODO: Not being called by the game object because
         it is immediately goes to the game state.
         """
+        self._ensure_icon()
         self.screen.fill((0, 0, 0))
         margin_offset = self.screen_margin_width
         rect = pygame.Rect(margin_offset,margin_offset,
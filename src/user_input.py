@@ -5,17 +5,48 @@ the parameters necessary to pass to the PCG generator functions.
 """
 
 
-import json
-import locale
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from collections import defaultdict
 
+import orjson
+
 from src.llm import generate_level_config, DEFAULT_MODEL
 from src.mission_to_geometry import adjust_layout_for_mission
 from src.mission_processor import place_objectives
 
+# Quick-select prompts, built once at import instead of per menu visit.
+# Designed to showcase all 6 algorithms.
+_DEFAULT_PROMPTS: dict[str, str] = {
+    "1": "classic dungeon with scattered rooms",
+    "2": "organized military fortress",
+    "3": "tight winding maze",
+    "4": "natural underground cave",
+    "5": "ancient citadel with hidden tunnels",
+    "6": "gladiator arena with battle chambers",
+}
+
+
+# Default config location, resolved once at import; Path.cwd() costs a
+# getcwd syscall per call and this path never changes at runtime.
+_DEFAULT_CONFIG_PATH = str(Path.cwd() / "jsons" / "sample.json")
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: str) -> dict[str, Any]:
+    """Read and parse a JSON config file, caching the result per path.
+
+    orjson parses the raw bytes several times faster than stdlib json, and the
+    lru_cache means regenerating with the same config hits memory, not disk.
+    Callers should shallow-copy the returned dict before mutating it.
+    """
+    config: dict[str, Any] = orjson.loads(Path(path).read_bytes())
+    return config
+
+
 def get_user_input() -> dict[str, Any]:
     """Function to select config params for procedurally generating a level based on the user input.
 
@@ -39,19 +70,17 @@ def get_user_input() -> dict[str, Any]:
     print("    - 'twisting natural caverns full of secrets'")
     print("    - 'tight military compound with organized rooms'")
 
-    user_input: str = input("\nEnter 1-6 or describe setting (Enter for #1): ").strip()
+    # Warm the default-config cache in the background while the user types;
+    # the fallback path then finds it already parsed (lru_cache is locked, so
+    # racing the prompt is safe).
+    threading.Thread(
+        target=_load_config, args=(_DEFAULT_CONFIG_PATH,), daemon=True
+    ).start()
 
-    # Check if numeric choice - designed to showcase all 6 algorithms
-    default_prompts = {
-        "1": "classic dungeon with scattered rooms",
-        "2": "organized military fortress",
-        "3": "tight winding maze",
-        "4": "natural underground cave",
-        "5": "ancient citadel with hidden tunnels",
-        "6": "gladiator arena with battle chambers",
-    }
+    user_input: str = input("\nEnter 1-6 or describe setting (Enter for #1): ").strip()
 
-    user_prompt = default_prompts.get(user_input, user_input)
+    # Check if numeric choice
+    user_prompt = _DEFAULT_PROMPTS.get(user_input, user_input)
 
     if user_prompt:
         # Generate config from LLM
@@ -61,17 +90,12 @@ def get_user_input() -> dict[str, Any]:
         except Exception as e:
             print(f"Error generating config: {e}")
             print("Loading default config instead...")
-            config_file_path = Path.joinpath(Path.cwd(), "jsons", "sample.json")
-            with open(config_file_path, "r", encoding=locale.getencoding()) as f:
-                config = json.load(f)
-                return config
+            # Shallow copy so mission adjustments don't mutate the cached dict
+            return dict(_load_config(_DEFAULT_CONFIG_PATH))
     else:
         # Load default config
         print("Loading default config instead...")
-        config_file_path = Path.joinpath(Path.cwd(), "jsons", "sample.json")
-        with open(config_file_path, "r", encoding=locale.getencoding()) as f:
-            config = json.load(f)
-            return config
+        return dict(_load_config(_DEFAULT_CONFIG_PATH))
     return config
 
 
@@ -110,8 +134,8 @@ def generate_custom_config(user_prompt: str) -> dict[str, Any]:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = logs_dir / f"generation_{timestamp}.json"
 
-    with open(log_file, "w", encoding="utf-8") as f:
-        json.dump(log_data, f, indent=2)
+    # orjson serializes straight to bytes, so skip the text-mode file layer
+    log_file.write_bytes(orjson.dumps(log_data, option=orjson.OPT_INDENT_2))
     print(f"Log saved to: {log_file}")
 
     return config
@@ -174,11 +198,14 @@ def place_mission_objectives(config: dict[str, Any], level_grid: list[list[int]]
         result: dict[str, Any] = place_objectives(level_grid, config["mission"])
 
         if "error" not in result:
+            # Grid dimensions are fixed for the whole summary; look them up once
+            map_height = len(level_grid)
+            map_width = len(level_grid[0])
             print("\n{'=' * 60}")
             print("  LEVEL GENERATION COMPLETE!")
             print("{'=' * 60}")
             print(
-                f"Map Size: {len(level_grid[0])}x{len(level_grid)})"
+                f"Map Size: {map_width}x{map_height})"
             )
             print(f"Rooms Found: {result['num_rooms']}")
             print(f"Starting Position: {result['start_pos']}")